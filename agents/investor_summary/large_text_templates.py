@@ -48,6 +48,8 @@ AVAILABLE PLACEHOLDERS:
 [Asset Manager Name] - The name of the asset manager (e.g., "Bank of Nova Scotia").
 """
 
+from typing import Optional, TextIO
+
 # =============================================================================
 # ⭐ CUSTOMIZE THIS: EXECUTIVE SUMMARY TEMPLATES ⭐
 # =============================================================================
@@ -455,11 +457,14 @@ def create_complete_document_from_templates(product_data: dict, audience: str =
 # ⭐ TESTING YOUR CUSTOMIZATIONS ⭐
 # =============================================================================
 
-def test_your_templates():
+def test_your_templates(out: Optional[TextIO] = None):
     """
     Test your customized templates with sample data.
     
     ⭐ MODIFY THE SAMPLE DATA BELOW to match your actual product information ⭐
+    
+    Args:
+        out: Stream the report is written to (defaults to stdout)
     """
     # Bank of Nova Scotia S&P 500 Autocallable Note test data
     your_sample_data = {
@@ -541,16 +546,16 @@ def test_your_templates():
     # Create document from your customized templates
     document = create_complete_document_from_templates(your_sample_data, "retail")
     
-    print("🧪 Testing Your Bank of Nova Scotia Customized Templates")
-    print("=" * 60)
-    print(f"✅ Executive summary: {len(document['executive_summary'])} characters")
-    print(f"✅ Key terms: {len(document['key_terms'])} characters")
-    print(f"✅ Additional key terms: {len(document['additional_key_terms'])} characters")
-    print(f"✅ Scenarios: {len(document['scenarios'])} characters")
-    print(f"✅ Disclaimer: {len(document['disclaimer'])} characters")
-    print("\n📄 Preview of Executive Summary:")
-    print(document['executive_summary'][:200] + "...")
-    print("\n✅ Bank of Nova Scotia templates ready for ISM agent!")
+    print("🧪 Testing Your Bank of Nova Scotia Customized Templates", file=out)
+    print("=" * 60, file=out)
+    print(f"✅ Executive summary: {len(document['executive_summary'])} characters", file=out)
+    print(f"✅ Key terms: {len(document['key_terms'])} characters", file=out)
+    print(f"✅ Additional key terms: {len(document['additional_key_terms'])} characters", file=out)
+    print(f"✅ Scenarios: {len(document['scenarios'])} characters", file=out)
+    print(f"✅ Disclaimer: {len(document['disclaimer'])} characters", file=out)
+    print("\n📄 Preview of Executive Summary:", file=out)
+    print(document['executive_summary'][:200] + "...", file=out)
+    print("\n✅ Bank of Nova Scotia templates ready for ISM agent!", file=out)
     
     return document
 
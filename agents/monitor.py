@@ -10,11 +10,16 @@ This module provides comprehensive monitoring capabilities for all agents:
 """
 
 import asyncio
+import bisect
+import functools
+import itertools
 import logging
 import time
-from typing import Dict, List, Optional, Any, Callable
+from array import array
+from collections import deque
+from typing import Deque, Dict, List, Optional, Any, Callable, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import threading
 import queue
@@ -68,6 +73,12 @@ class HealthCheck:
     response_time: float
     error_message: Optional[str] = None
     details: Dict[str, Any] = field(default_factory=dict)
+    # Same duration as response_time in integer nanoseconds (derived from it when not given)
+    response_time_ns: Optional[int] = None
+    
+    def __post_init__(self):
+        if self.response_time_ns is None:
+            self.response_time_ns = int(self.response_time * 1e9)
 
 
 @dataclass
@@ -80,6 +91,54 @@ class Alert:
     details: Dict[str, Any] = field(default_factory=dict)
 
 
+class _AlertIndex:
+    """Alerts in timestamp order with a parallel array of POSIX timestamps for bisecting time cutoffs"""
+    
+    __slots__ = ("alerts", "timestamps")
+    
+    def __init__(self, maxlen: Optional[int] = None):
+        self.alerts: Deque[Alert] = deque(maxlen=maxlen)
+        self.timestamps = array('d')
+    
+    def __len__(self) -> int:
+        return len(self.alerts)
+    
+    def is_full(self) -> bool:
+        return self.alerts.maxlen is not None and len(self.alerts) == self.alerts.maxlen
+    
+    def insert(self, alert: Alert):
+        """
+        Insert an alert at its timestamp position (after any equal timestamps).
+        
+        Alerts from several producers, or stamped across a wall-clock step, can arrive
+        out of order; the caller evicts first when the index is full.
+        """
+        timestamp = alert.timestamp.timestamp()
+        position = bisect.bisect_right(self.timestamps, timestamp)
+        if position == len(self.timestamps):
+            self.alerts.append(alert)
+            self.timestamps.append(timestamp)
+        else:
+            self.alerts.insert(position, alert)
+            self.timestamps.insert(position, timestamp)
+    
+    def popleft(self) -> Alert:
+        del self.timestamps[0]
+        return self.alerts.popleft()
+    
+    def since(self, cutoff: float) -> List[Alert]:
+        """Alerts raised at or after the cutoff timestamp"""
+        start = bisect.bisect_left(self.timestamps, cutoff)
+        return list(itertools.islice(self.alerts, start, None))
+    
+    def drop_before(self, cutoff: float):
+        """Remove alerts raised before the cutoff timestamp"""
+        expired = bisect.bisect_left(self.timestamps, cutoff)
+        for _ in range(expired):
+            self.alerts.popleft()
+        del self.timestamps[:expired]
+
+
 class AgentMonitor:
     """
     Comprehensive monitoring system for all agents.
@@ -92,28 +151,73 @@ class AgentMonitor:
     - Historical data collection
     """
     
-    def __init__(self, check_interval: int = 60):
+    # Seconds a computed monitoring summary may be reused while no monitor state changes
+    SUMMARY_CACHE_TTL = 1.0
+    # Alert raised for each unhealthy status: status -> (level, message format)
+    _ALERT_RULES: Dict[MonitorStatus, Tuple[AlertLevel, str]] = {
+        MonitorStatus.CRITICAL: (AlertLevel.CRITICAL, "Agent {agent_type} is in critical state: {error_message}"),
+        MonitorStatus.WARNING: (AlertLevel.WARNING, "Agent {agent_type} is in warning state"),
+    }
+    # Health checks slower than this raise a high response time warning (10 seconds)
+    RESPONSE_TIME_THRESHOLD_NS = 10_000_000_000
+    
+    def __init__(self, check_interval: int = 60, max_alerts: int = 10000):
         """
         Initialize the agent monitor.
         
         Args:
             check_interval: Interval in seconds between health checks
+            max_alerts: Number of most recent alerts to retain
         """
         self.check_interval = check_interval
         self.registry = agent_registry
         self.factory = agent_factory
         
-        # Monitoring state
+        # Monitoring state - health checks run as coroutines on a dedicated event loop
         self.is_monitoring = False
-        self.monitor_thread = None
+        self.monitor_task = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
         self.health_cache: Dict[str, HealthCheck] = {}
+        # Agent instances reused across health checks; dropped on failure so they get rebuilt
+        self._probe_agents: Dict[str, Any] = {}
+        # Per-agent-type overrides of RESPONSE_TIME_THRESHOLD_NS
+        self.response_time_thresholds_ns: Dict[str, int] = {}
+        # Per-agent-type capabilities, probed once since they are fixed by the agent class
+        self._capabilities: Dict[str, Dict[str, bool]] = {}
         self.performance_metrics: Dict[str, PerformanceMetrics] = {}
-        self.alerts: List[Alert] = []
+        # Read-only snapshots handed out by get_all_*; republished by writers on change
+        self._health_snapshot: Dict[str, HealthCheck] = {}
+        self._performance_snapshot: Dict[str, PerformanceMetrics] = {}
+        
+        # get_monitoring_summary cache, invalidated by bumping _summary_version on writes
+        self._summary_version = 0
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        self._summary_cache_version = -1
+        self._summary_cache_time = 0.0
+        # Alerts are kept in timestamp order, both overall and per level, so time cutoffs
+        # can be found by bisection; the indexes are only touched under _alert_consumer_lock
+        self._alert_index = _AlertIndex(maxlen=max_alerts)
+        self._alerts_by_level: Dict[AlertLevel, _AlertIndex] = {level: _AlertIndex() for level in AlertLevel}
+        # Producers only enqueue; one consumer at a time moves alerts into the history
+        self._alert_queue: "queue.SimpleQueue[Alert]" = queue.SimpleQueue()
+        self._alert_consumer_lock = threading.RLock()
         self.alert_callbacks: List[Callable[[Alert], None]] = []
         
         # Initialize metrics for all agents
         self._initialize_metrics()
     
+    @property
+    def alerts(self) -> Deque[Alert]:
+        """
+        Overall alert history, oldest first, with queued alerts recorded first.
+        
+        The deque is live monitor state and must be treated as read-only.
+        """
+        self._drain_alerts()
+        return self._alert_index.alerts
+    
     def start_monitoring(self):
         """Start the monitoring system"""
         if self.is_monitoring:
@@ -121,15 +225,17 @@ class AgentMonitor:
             return
         
         self.is_monitoring = True
-        self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
-        self.monitor_thread.start()
+        self._summary_version += 1
+        self.monitor_task = asyncio.run_coroutine_threadsafe(self._monitor_loop(), self._get_loop())
         logger.info("Agent monitoring started")
     
     def stop_monitoring(self):
         """Stop the monitoring system"""
         self.is_monitoring = False
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=5)
+        self._summary_version += 1
+        if self.monitor_task:
+            self.monitor_task.cancel()
+            self.monitor_task = None
         logger.info("Agent monitoring stopped")
     
     def add_alert_callback(self, callback: Callable[[Alert], None]):
@@ -146,16 +252,25 @@ class AgentMonitor:
         return self.health_cache.get(agent_type)
     
     def get_all_agent_health(self) -> Dict[str, HealthCheck]:
-        """Get health information for all agents"""
-        return self.health_cache.copy()
+        """
+        Get health information for all agents.
+        
+        The returned dict is a shared snapshot and must be treated as read-only.
+        """
+        return self._health_snapshot
     
     def get_agent_performance(self, agent_type: str) -> Optional[PerformanceMetrics]:
         """Get performance metrics for a specific agent"""
         return self.performance_metrics.get(agent_type)
     
     def get_all_performance_metrics(self) -> Dict[str, PerformanceMetrics]:
-        """Get performance metrics for all agents"""
-        return self.performance_metrics.copy()
+        """
+        Get performance metrics for all agents.
+        
+        The returned dict holds copies taken when the metrics last changed, so it does not
+        change after it is returned; it is shared and must be treated as read-only.
+        """
+        return self._performance_snapshot
     
     def get_alerts(self, level: Optional[AlertLevel] = None, hours: int = 24) -> List[Alert]:
         """
@@ -168,40 +283,62 @@ class AgentMonitor:
         Returns:
             List of alerts matching the criteria
         """
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        
-        filtered_alerts = [
-            alert for alert in self.alerts
-            if alert.timestamp >= cutoff_time
-        ]
-        
-        if level:
-            filtered_alerts = [
-                alert for alert in filtered_alerts
-                if alert.level == level
-            ]
-        
-        return filtered_alerts
+        with self._alert_consumer_lock:
+            self._drain_alerts()
+            index = self._alerts_by_level[level] if level else self._alert_index
+            return index.since(self._alert_cutoff(hours))
+    
+    def get_alert_context(self, alert: Alert) -> Optional[HealthCheck]:
+        """Get the latest health check for the agent an alert was raised for"""
+        return self.health_cache.get(alert.agent_type)
     
     def clear_alerts(self, hours: int = 24):
         """Clear alerts older than specified hours"""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        self.alerts = [
-            alert for alert in self.alerts
-            if alert.timestamp >= cutoff_time
-        ]
+        with self._alert_consumer_lock:
+            self._drain_alerts()
+            cutoff = self._alert_cutoff(hours)
+            self._alert_index.drop_before(cutoff)
+            for index in self._alerts_by_level.values():
+                index.drop_before(cutoff)
+            self._summary_version += 1
+    
+    def _alert_cutoff(self, hours: int) -> float:
+        """POSIX timestamp `hours` hours ago"""
+        return (datetime.now() - timedelta(hours=hours)).timestamp()
     
     def run_health_check(self, agent_type: str) -> HealthCheck:
         """
         Run a health check for a specific agent.
         
+        Synchronous wrapper around run_health_check_async that executes on the
+        monitor's event loop.
+        
+        Args:
+            agent_type: Type of agent to check
+            
+        Returns:
+            Health check result
+        """
+        return self._run_sync(self.run_health_check_async(agent_type))
+    
+    def run_all_health_checks(self) -> Dict[str, HealthCheck]:
+        """Run health checks for all agents (synchronous wrapper)"""
+        return self._run_sync(self.run_all_health_checks_async())
+    
+    async def run_health_check_async(self, agent_type: str, now: Optional[datetime] = None) -> HealthCheck:
+        """
+        Run a health check for a specific agent.
+        
         Args:
             agent_type: Type of agent to check
+            now: Timestamp to record on the result (defaults to the current time)
             
         Returns:
             Health check result
         """
-        start_time = time.time()
+        # Durations use the monotonic clock; datetime.now() is only for the displayed timestamp
+        start_ns = time.monotonic_ns()
+        timestamp = now or datetime.now()
         
         try:
             # Get agent metadata
@@ -210,7 +347,7 @@ class AgentMonitor:
                 return HealthCheck(
                     agent_type=agent_type,
                     status=MonitorStatus.OFFLINE,
-                    timestamp=datetime.now(),
+                    timestamp=timestamp,
                     response_time=0.0,
                     error_message=f"Agent {agent_type} not found in registry"
                 )
@@ -220,46 +357,54 @@ class AgentMonitor:
                 return HealthCheck(
                     agent_type=agent_type,
                     status=MonitorStatus.OFFLINE,
-                    timestamp=datetime.now(),
+                    timestamp=timestamp,
                     response_time=0.0,
                     error_message=f"Agent {agent_type} is deprecated"
                 )
             
-            # Try to create agent instance
-            agent = self.factory.create_agent(agent_type, enable_monitoring=False)
+            # Reuse the probe agent, creating it off the event loop if needed (construction is synchronous)
+            agent = self._probe_agents.get(agent_type)
+            if agent is None:
+                loop = asyncio.get_running_loop()
+                agent = await loop.run_in_executor(
+                    None, functools.partial(self.factory.create_agent, agent_type, enable_monitoring=False)
+                )
             if not agent:
                 return HealthCheck(
                     agent_type=agent_type,
                     status=MonitorStatus.CRITICAL,
-                    timestamp=datetime.now(),
-                    response_time=time.time() - start_time,
+                    timestamp=timestamp,
+                    response_time=(time.monotonic_ns() - start_ns) / 1e9,
                     error_message=f"Failed to create agent {agent_type}"
                 )
             
             # Test basic functionality
             test_result = self._test_agent_functionality(agent, agent_type)
             
-            response_time = time.time() - start_time
+            elapsed_ns = time.monotonic_ns() - start_ns
             
             # Determine status based on test result
             if test_result["success"]:
                 status = MonitorStatus.HEALTHY
                 error_message = None
+                self._probe_agents[agent_type] = agent
             else:
                 status = MonitorStatus.CRITICAL
                 error_message = test_result["error"]
+                self._probe_agents.pop(agent_type, None)
             
             health_check = HealthCheck(
                 agent_type=agent_type,
                 status=status,
-                timestamp=datetime.now(),
-                response_time=response_time,
+                timestamp=timestamp,
+                response_time=elapsed_ns / 1e9,
+                response_time_ns=elapsed_ns,
                 error_message=error_message,
                 details=test_result.get("details", {})
             )
             
             # Update cache
-            self.health_cache[agent_type] = health_check
+            self._record_health(agent_type, health_check)
             
             # Update performance metrics
             self._update_performance_metrics(agent_type, health_check)
@@ -270,33 +415,48 @@ class AgentMonitor:
             return health_check
             
         except Exception as e:
-            response_time = time.time() - start_time
+            self._probe_agents.pop(agent_type, None)
+            elapsed_ns = time.monotonic_ns() - start_ns
             health_check = HealthCheck(
                 agent_type=agent_type,
                 status=MonitorStatus.CRITICAL,
-                timestamp=datetime.now(),
-                response_time=response_time,
+                timestamp=timestamp,
+                response_time=elapsed_ns / 1e9,
+                response_time_ns=elapsed_ns,
                 error_message=str(e)
             )
             
-            self.health_cache[agent_type] = health_check
+            self._record_health(agent_type, health_check)
             self._update_performance_metrics(agent_type, health_check)
             self._check_for_alerts(agent_type, health_check)
             
             return health_check
     
-    def run_all_health_checks(self) -> Dict[str, HealthCheck]:
-        """Run health checks for all agents"""
-        all_agents = self.registry.get_all_agents()
-        results = {}
-        
-        for agent_type in all_agents.keys():
-            results[agent_type] = self.run_health_check(agent_type)
+    async def run_all_health_checks_async(self) -> Dict[str, HealthCheck]:
+        """Run health checks for all agents concurrently"""
+        # One registry snapshot and one timestamp per monitoring cycle
+        now = datetime.now()
+        agent_types = list(self.registry.get_all_agents())
+        health_checks = await asyncio.gather(
+            *(self.run_health_check_async(agent_type, now=now) for agent_type in agent_types)
+        )
         
-        return results
+        return dict(zip(agent_types, health_checks))
     
     def get_monitoring_summary(self) -> Dict[str, Any]:
-        """Get a summary of monitoring status"""
+        """
+        Get a summary of monitoring status.
+        
+        The summary is reused for up to SUMMARY_CACHE_TTL seconds while no health
+        checks, metrics or alerts change; treat the returned dict as read-only.
+        """
+        self._drain_alerts()
+        if (self._summary_cache is not None
+                and self._summary_cache_version == self._summary_version
+                and time.monotonic() - self._summary_cache_time < self.SUMMARY_CACHE_TTL):
+            return self._summary_cache
+        
+        version = self._summary_version
         all_agents = self.registry.get_all_agents()
         summary = {
             "total_agents": len(all_agents),
@@ -306,17 +466,19 @@ class AgentMonitor:
             "recent_alerts": len(self.get_alerts(hours=1))
         }
         
-        # Health status summary
-        for agent_type in all_agents.keys():
-            health = self.get_agent_health(agent_type)
+        # Read from the published snapshots so health and performance agree with each other
+        health_snapshot = self._health_snapshot
+        performance_snapshot = self._performance_snapshot
+        for agent_type in all_agents:
+            # Health status summary
+            health = health_snapshot.get(agent_type)
             if health:
                 summary["health_status"][agent_type] = health.status.value
             else:
                 summary["health_status"][agent_type] = MonitorStatus.UNKNOWN.value
-        
-        # Performance summary
-        for agent_type in all_agents.keys():
-            metrics = self.get_agent_performance(agent_type)
+            
+            # Performance summary
+            metrics = performance_snapshot.get(agent_type)
             if metrics:
                 summary["performance_summary"][agent_type] = {
                     "success_rate": metrics.success_rate,
@@ -324,8 +486,15 @@ class AgentMonitor:
                     "total_requests": metrics.total_requests
                 }
         
+        self._summary_cache = summary
+        self._summary_cache_version = version
+        self._summary_cache_time = time.monotonic()
         return summary
     
+    def invalidate_summary_cache(self):
+        """Force the next get_monitoring_summary call to recompute"""
+        self._summary_cache = None
+    
     def _initialize_metrics(self):
         """Initialize performance metrics for all agents"""
         all_agents = self.registry.get_all_agents()
@@ -334,20 +503,47 @@ class AgentMonitor:
             self.performance_metrics[agent_type] = PerformanceMetrics(
                 agent_type=agent_type
             )
+        self._performance_snapshot = {
+            agent_type: replace(metrics) for agent_type, metrics in self.performance_metrics.items()
+        }
+    
+    def _record_health(self, agent_type: str, health_check: HealthCheck):
+        """Cache a health check result and publish a fresh snapshot for readers"""
+        self.health_cache[agent_type] = health_check
+        self._health_snapshot = dict(self.health_cache)
+        self._summary_version += 1
+    
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the monitor's event loop, starting its background thread on first use"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="agent-monitor", daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
     
-    def _monitor_loop(self):
+    def _run_sync(self, coro) -> Any:
+        """Run a coroutine on the monitor's event loop and wait for its result"""
+        if threading.current_thread() is self._loop_thread:
+            coro.close()
+            raise RuntimeError("Use the async health check methods from within the monitor loop")
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result()
+    
+    async def _monitor_loop(self):
         """Main monitoring loop"""
         while self.is_monitoring:
             try:
                 logger.debug("Running scheduled health checks")
-                self.run_all_health_checks()
+                await self.run_all_health_checks_async()
                 
                 # Wait for next check interval
-                time.sleep(self.check_interval)
+                await asyncio.sleep(self.check_interval)
                 
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(10)  # Short delay before retry
+                await asyncio.sleep(10)  # Short delay before retry
     
     def _test_agent_functionality(self, agent: Any, agent_type: str) -> Dict[str, Any]:
         """Test basic functionality of an agent"""
@@ -356,13 +552,11 @@ class AgentMonitor:
             agent_info = agent.get_agent_info()
             
             # Test knowledge base access (if available)
-            knowledge_status = "unknown"
-            try:
-                if hasattr(agent, 'initialize_lightrag'):
-                    # This is a simplified test - in practice you'd want more comprehensive testing
-                    knowledge_status = "available"
-            except:
-                knowledge_status = "unavailable"
+            capabilities = self._capabilities.get(agent_type)
+            if capabilities is None:
+                capabilities = self._capabilities[agent_type] = self._probe_capabilities(agent)
+            # This is a simplified test - in practice you'd want more comprehensive testing
+            knowledge_status = "available" if capabilities["has_lightrag"] else "unknown"
             
             return {
                 "success": True,
@@ -380,63 +574,66 @@ class AgentMonitor:
                 "details": {"agent_type": agent_type}
             }
     
+    @staticmethod
+    def _probe_capabilities(agent: Any) -> Dict[str, bool]:
+        """Determine which optional features an agent supports"""
+        return {"has_lightrag": hasattr(agent, 'initialize_lightrag')}
+    
     def _update_performance_metrics(self, agent_type: str, health_check: HealthCheck):
         """Update performance metrics based on health check"""
         metrics = self.performance_metrics.get(agent_type)
-        if not metrics:
-            metrics = PerformanceMetrics(agent_type=agent_type)
-            self.performance_metrics[agent_type] = metrics
+        if metrics is None:
+            # _initialize_metrics covers registered agents, so this only happens for unknown types
+            logger.warning(f"No performance metrics initialized for agent {agent_type}; creating them")
+            metrics = self.performance_metrics.setdefault(agent_type, PerformanceMetrics(agent_type=agent_type))
         
         # Update metrics
-        metrics.total_requests += 1
+        total = metrics.total_requests + 1
+        metrics.total_requests = total
         metrics.last_request_time = health_check.timestamp
         
-        # Update response time statistics
+        # Update response time statistics (incremental mean over all requests)
         response_time = health_check.response_time
-        if metrics.response_time_avg == 0:
+        if total == 1:
             metrics.response_time_avg = response_time
             metrics.response_time_min = response_time
             metrics.response_time_max = response_time
         else:
-            metrics.response_time_avg = (metrics.response_time_avg + response_time) / 2
-            metrics.response_time_min = min(metrics.response_time_min, response_time)
-            metrics.response_time_max = max(metrics.response_time_max, response_time)
+            rt_avg = metrics.response_time_avg
+            metrics.response_time_avg = rt_avg + (response_time - rt_avg) / total
+            if response_time < metrics.response_time_min:
+                metrics.response_time_min = response_time
+            if response_time > metrics.response_time_max:
+                metrics.response_time_max = response_time
         
         # Update success rate
-        if health_check.status == MonitorStatus.HEALTHY:
-            success_count = metrics.total_requests - metrics.error_count
-        else:
-            metrics.error_count += 1
-            success_count = metrics.total_requests - metrics.error_count
+        error_count = metrics.error_count
+        if health_check.status != MonitorStatus.HEALTHY:
+            error_count += 1
+            metrics.error_count = error_count
         
-        metrics.success_rate = success_count / metrics.total_requests if metrics.total_requests > 0 else 0.0
+        metrics.success_rate = (total - error_count) / total
+        # Publish a copy so snapshots already handed out keep their values
+        self._performance_snapshot = {**self._performance_snapshot, agent_type: replace(metrics)}
+        self._summary_version += 1
     
     def _check_for_alerts(self, agent_type: str, health_check: HealthCheck):
         """Check for conditions that should trigger alerts"""
-        # Check for critical status
-        if health_check.status == MonitorStatus.CRITICAL:
+        # Check for critical or warning status
+        rule = self._ALERT_RULES.get(health_check.status)
+        if rule is not None:
+            level, message = rule
             alert = Alert(
                 agent_type=agent_type,
-                level=AlertLevel.CRITICAL,
-                message=f"Agent {agent_type} is in critical state: {health_check.error_message}",
-                timestamp=datetime.now(),
-                details={"health_check": health_check.__dict__}
-            )
-            self._trigger_alert(alert)
-        
-        # Check for warning status
-        elif health_check.status == MonitorStatus.WARNING:
-            alert = Alert(
-                agent_type=agent_type,
-                level=AlertLevel.WARNING,
-                message=f"Agent {agent_type} is in warning state",
+                level=level,
+                message=message.format(agent_type=agent_type, error_message=health_check.error_message),
                 timestamp=datetime.now(),
-                details={"health_check": health_check.__dict__}
+                details=self._alert_details(health_check)
             )
             self._trigger_alert(alert)
         
         # Check for high response time
-        elif health_check.response_time > 10.0:  # 10 seconds threshold
+        elif health_check.response_time_ns > self.response_time_thresholds_ns.get(agent_type, self.RESPONSE_TIME_THRESHOLD_NS):
             alert = Alert(
                 agent_type=agent_type,
                 level=AlertLevel.WARNING,
@@ -446,17 +643,59 @@ class AgentMonitor:
             )
             self._trigger_alert(alert)
     
+    @staticmethod
+    def _alert_details(health_check: HealthCheck) -> Dict[str, Any]:
+        """Compact health check summary stored on alerts (see get_alert_context for the full check)"""
+        return {
+            "status": health_check.status.value,
+            "response_time": health_check.response_time,
+            "error": health_check.error_message
+        }
+    
     def _trigger_alert(self, alert: Alert):
-        """Trigger an alert and notify callbacks"""
-        self.alerts.append(alert)
-        logger.warning(f"Alert: {alert.message}")
+        """Queue an alert; the consumer records it and notifies callbacks"""
+        self._alert_queue.put_nowait(alert)
         
-        # Notify callbacks
-        for callback in self.alert_callbacks:
-            try:
-                callback(alert)
-            except Exception as e:
-                logger.error(f"Error in alert callback: {e}")
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(self._drain_alerts)
+        else:
+            self._drain_alerts()
+    
+    def _drain_alerts(self):
+        """Move queued alerts into the alert history and notify callbacks"""
+        if self._alert_queue.empty():
+            return
+        
+        with self._alert_consumer_lock:
+            while True:
+                try:
+                    alert = self._alert_queue.get_nowait()
+                except queue.Empty:
+                    return
+                
+                if not self._alert_index.is_full():
+                    record = True
+                elif alert.timestamp.timestamp() < self._alert_index.timestamps[0]:
+                    # Older than the whole retained history, so it would be evicted at once
+                    record = False
+                else:
+                    # The oldest alert overall is also the oldest of its level
+                    evicted = self._alert_index.popleft()
+                    self._alerts_by_level[evicted.level].popleft()
+                    record = True
+                if record:
+                    self._alert_index.insert(alert)
+                    self._alerts_by_level[alert.level].insert(alert)
+                    self._summary_version += 1
+                logger.warning(f"Alert: {alert.message}")
+                
+                # Notify callbacks
+                for callback in self.alert_callbacks:
+                    try:
+                        callback(alert)
+                    except Exception as e:
+                        logger.error(f"Error in alert callback: {e}")
 
 
 # Global monitor instance
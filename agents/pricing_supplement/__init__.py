@@ -6,11 +6,16 @@ supplements that contain final pricing and terms, referencing the
 base shelf prospectus.
 """
 
+import logging
+
 from .agent import PRSAgent
 from .models import PRSInput, PRSOutput, PRSAgentDeps
 from .config import PRSConfig
 from .large_text_agent import LargeTextPRSAgent
 from .document_generator import PRSDocumentGenerator
+
+# Library logging stays silent unless the application configures handlers
+logging.getLogger(__name__).addHandler(logging.NullHandler())
  
 __all__ = [
     "PRSAgent",
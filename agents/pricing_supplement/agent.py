@@ -2,18 +2,132 @@
 PRS (Pricing Supplement) Agent implementation using Pydantic AI framework.
 """
 
-from typing import Optional
+import asyncio
+from typing import Dict, Optional, Tuple
 from datetime import datetime
 from pydantic_ai import Agent, RunContext
-from lightrag import LightRAG, QueryParam
+from lightrag import LightRAG
 
 from core.base_agent import BaseFinancialAgent
 from core.knowledge_updater import KnowledgeUpdater
+from core.query_cache import query_cache
 from .models import PRSInput, PRSOutput, PRSAgentDeps
 from .instructions import PRSInstructions
 from .config import PRSConfig
 
 
+# Knowledge base retrievals used by the PRS tools: key -> (heading, query template, top_k, error subject)
+_PRS_RETRIEVALS: Dict[str, Tuple[str, str, int, str]] = {
+    "base_prospectus": (
+        "**Base Prospectus Content:**",
+        "base prospectus {reference} {section_keywords} key sections",
+        8, "base prospectus"
+    ),
+    "pricing_methodology": (
+        "**Pricing Methodology:**",
+        "{product_type} pricing methodology {underlying_asset} examples disclosure",
+        10, "pricing methodology"
+    ),
+    "market_data": (
+        "**Market Data at Pricing:**",
+        "{underlying_asset} market data around {pricing_date} pricing context",
+        6, "market data"
+    ),
+    "regulatory_pricing_disclosures": (
+        "**Regulatory Pricing Disclosures:**",
+        "regulatory pricing disclosures {jurisdiction} pricing supplement mandatory language",
+        5, "regulatory disclosures"
+    ),
+    "final_terms_templates": (
+        "**Final Terms Templates:**",
+        "{product_type} pricing supplement final terms table template {audience}",
+        8, "final terms templates"
+    ),
+    "estimated_value_language": (
+        "**Estimated Value Language:**",
+        "{jurisdiction} pricing supplement estimated value disclosure standard language",
+        6, "estimated value language"
+    ),
+    "distribution_and_fees_templates": (
+        "**Distribution & Fees Templates:**",
+        "{jurisdiction} pricing supplement distribution selling restrictions denominations fees templates",
+        6, "distribution and fees templates"
+    ),
+}
+
+
+async def _retrieve(lightrag: LightRAG, key: str, **fields: str) -> str:
+    """Run one PRS knowledge base retrieval and format it under its heading"""
+    heading, query_template, top_k, subject = _PRS_RETRIEVALS[key]
+    try:
+        query = query_template.format(**fields)
+        result = await query_cache.aquery(lightrag, query, mode="mix", top_k=top_k)
+        return f"{heading}\n{result}"
+    except Exception as e:
+        return f"Error retrieving {subject}: {str(e)}"
+
+
+# User prompt for PRS document generation, filled in by PRSAgent._format_user_prompt
+_USER_PROMPT_TEMPLATE = """
+        Generate a comprehensive Pricing Supplement for the following issuance. This document must
+        present final terms, pricing methodology, market data at pricing, settlement instructions,
+        and regulatory notices, and must cross-reference the Base Prospectus.
+
+        ## Reference Documents
+        - Base Prospectus: {base_prospectus_reference}
+        - Supplement Reference: {supplement_reference}
+
+        ## Final Pricing Information
+        - Final Issue Price: {final_issue_price}% of principal
+        - Final Principal Amount: {final_principal_amount} {currency}
+        - Currency: {currency}
+
+        ## Final Dates
+        - Pricing Date: {pricing_date}
+        - Issue Date: {issue_date}
+        - Maturity Date: {maturity_date}
+        - Settlement Date: {settlement_date}
+
+        ## Final Terms
+        - Final Coupon Rate: {final_coupon_rate}
+        - Final Barrier Level: {final_barrier_level}
+        - Underlying Initial Level: {underlying_initial_level}
+
+        ## Market Data at Pricing
+        - Underlying Price at Pricing: {underlying_price_at_pricing}
+        - Market Conditions: {market_conditions}
+        - Implied Volatility: {volatility_at_pricing}
+
+        ## Distribution & Fees
+        - Distribution Method: {distribution_method}
+        - Minimum Denomination: {minimum_denomination}
+        - Agent Discount: {agent_discount}
+        - Estimated Value: {estimated_value}
+
+        ## REQUIRED TOOL USAGE
+        Prefer retrieve_prs_context(...), which runs all of the retrievals below concurrently in a
+        single call; use the individual tools only to refine a specific section.
+        1. retrieve_base_prospectus(reference, section_keywords="summary risk factors pricing")
+        2. retrieve_pricing_methodology(product_type="{distribution_method}", underlying_asset="{currency}")  # NOTE: If product_type is needed, pass correct type instead of distribution
+        3. retrieve_market_data(underlying_asset="{distribution_method}", pricing_date="{pricing_date_iso}")  # NOTE: Replace placeholders with real underlying asset symbol/name
+        4. retrieve_regulatory_pricing_disclosures(jurisdiction="Canada")
+
+        ## OUTPUT REQUIREMENTS
+        Return a complete PRSOutput including: document_title, pricing_summary, document_references,
+        final_terms_summary, final_terms_table, pricing_methodology, estimated_value_explanation,
+        settlement_instructions, delivery_procedures, distribution_information, market_data_at_pricing,
+        fees_and_expenses, regulatory_notices, contact_information, additional_sections, document_version,
+        pricing_timestamp, and generation_date. Use formal, precise disclosure language.
+
+        Generation Date: {generation_date}
+        """
+
+
+def _or_default(value: Optional[float], default: str) -> object:
+    """Return the value, or the default placeholder when it is missing"""
+    return value if value is not None else default
+
+
 class PRSAgent(BaseFinancialAgent[PRSInput, PRSOutput, PRSAgentDeps]):
     """
     PRS (Pricing Supplement) Agent specialized in generating pricing supplement 
@@ -57,6 +171,36 @@ class PRSAgent(BaseFinancialAgent[PRSInput, PRSOutput, PRSAgentDeps]):
     def _register_agent_tools(self):
         """Register PRS-specific tools for document generation"""
         
+        @self.agent.tool
+        async def retrieve_prs_context(
+            ctx: RunContext[PRSAgentDeps],
+            reference: str,
+            product_type: str,
+            underlying_asset: str,
+            pricing_date: str,
+            jurisdiction: str = "Canada",
+            audience: str = "institutional",
+            section_keywords: str = "summary risk factors pricing"
+        ) -> str:
+            """
+            Retrieve all PRS knowledge base context in one call: base prospectus sections, pricing
+            methodology, market data, regulatory disclosures, final terms templates, estimated value
+            language, and distribution/fees templates. Queries run concurrently.
+            """
+            fields = {
+                "reference": reference,
+                "section_keywords": section_keywords,
+                "product_type": product_type,
+                "underlying_asset": underlying_asset,
+                "pricing_date": pricing_date,
+                "jurisdiction": jurisdiction,
+                "audience": audience,
+            }
+            results = await asyncio.gather(
+                *(_retrieve(ctx.deps.lightrag, key, **fields) for key in _PRS_RETRIEVALS)
+            )
+            return "\n\n".join(results)
+        
         @self.agent.tool
         async def retrieve_base_prospectus(
             ctx: RunContext[PRSAgentDeps], 
@@ -66,12 +210,7 @@ class PRSAgent(BaseFinancialAgent[PRSInput, PRSOutput, PRSAgentDeps]):
             """
             Retrieve relevant sections from the base shelf prospectus referenced by this pricing supplement.
             """
-            try:
-                query = f"base prospectus {reference} {section_keywords} key sections"
-                result = await ctx.deps.lightrag.aquery(query, param=QueryParam(mode="mix", top_k=8))
-                return f"**Base Prospectus Content:**\n{result}"
-            except Exception as e:
-                return f"Error retrieving base prospectus: {str(e)}"
+            return await _retrieve(ctx.deps.lightrag, "base_prospectus", reference=reference, section_keywords=section_keywords)
 
         @self.agent.tool
         async def retrieve_pricing_methodology(
@@ -82,12 +221,7 @@ class PRSAgent(BaseFinancialAgent[PRSInput, PRSOutput, PRSAgentDeps]):
             """
             Retrieve pricing methodology examples and language.
             """
-            try:
-                query = f"{product_type} pricing methodology {underlying_asset} examples disclosure"
-                result = await ctx.deps.lightrag.aquery(query, param=QueryParam(mode="mix", top_k=10))
-                return f"**Pricing Methodology:**\n{result}"
-            except Exception as e:
-                return f"Error retrieving pricing methodology: {str(e)}"
+            return await _retrieve(ctx.deps.lightrag, "pricing_methodology", product_type=product_type, underlying_asset=underlying_asset)
 
         @self.agent.tool
         async def retrieve_market_data(
@@ -98,12 +232,7 @@ class PRSAgent(BaseFinancialAgent[PRSInput, PRSOutput, PRSAgentDeps]):
             """
             Retrieve market data context used at pricing time.
             """
-            try:
-                query = f"{underlying_asset} market data around {pricing_date} pricing context"
-                result = await ctx.deps.lightrag.aquery(query, param=QueryParam(mode="mix", top_k=6))
-                return f"**Market Data at Pricing:**\n{result}"
-            except Exception as e:
-                return f"Error retrieving market data: {str(e)}"
+            return await _retrieve(ctx.deps.lightrag, "market_data", underlying_asset=underlying_asset, pricing_date=pricing_date)
 
         @self.agent.tool
         async def retrieve_regulatory_pricing_disclosures(
@@ -113,12 +242,7 @@ class PRSAgent(BaseFinancialAgent[PRSInput, PRSOutput, PRSAgentDeps]):
             """
             Retrieve regulatory notices and mandatory pricing disclosures.
             """
-            try:
-                query = f"regulatory pricing disclosures {jurisdiction} pricing supplement mandatory language"
-                result = await ctx.deps.lightrag.aquery(query, param=QueryParam(mode="mix", top_k=5))
-                return f"**Regulatory Pricing Disclosures:**\n{result}"
-            except Exception as e:
-                return f"Error retrieving regulatory disclosures: {str(e)}"
+            return await _retrieve(ctx.deps.lightrag, "regulatory_pricing_disclosures", jurisdiction=jurisdiction)
 
         @self.agent.tool
         async def retrieve_final_terms_templates(
@@ -129,12 +253,7 @@ class PRSAgent(BaseFinancialAgent[PRSInput, PRSOutput, PRSAgentDeps]):
             """
             Retrieve templates/snippets for final terms section and tabular presentation.
             """
-            try:
-                query = f"{product_type} pricing supplement final terms table template {audience}"
-                result = await ctx.deps.lightrag.aquery(query, param=QueryParam(mode="mix", top_k=8))
-                return f"**Final Terms Templates:**\n{result}"
-            except Exception as e:
-                return f"Error retrieving final terms templates: {str(e)}"
+            return await _retrieve(ctx.deps.lightrag, "final_terms_templates", product_type=product_type, audience=audience)
 
         @self.agent.tool
         async def retrieve_estimated_value_language(
@@ -144,12 +263,7 @@ class PRSAgent(BaseFinancialAgent[PRSInput, PRSOutput, PRSAgentDeps]):
             """
             Retrieve standard language for estimated value disclosures at issuance.
             """
-            try:
-                query = f"{jurisdiction} pricing supplement estimated value disclosure standard language"
-                result = await ctx.deps.lightrag.aquery(query, param=QueryParam(mode="mix", top_k=6))
-                return f"**Estimated Value Language:**\n{result}"
-            except Exception as e:
-                return f"Error retrieving estimated value language: {str(e)}"
+            return await _retrieve(ctx.deps.lightrag, "estimated_value_language", jurisdiction=jurisdiction)
 
         @self.agent.tool
         async def retrieve_distribution_and_fees_templates(
@@ -159,12 +273,7 @@ class PRSAgent(BaseFinancialAgent[PRSInput, PRSOutput, PRSAgentDeps]):
             """
             Retrieve templates for distribution, selling restrictions, denominations, and fees breakdowns.
             """
-            try:
-                query = f"{jurisdiction} pricing supplement distribution selling restrictions denominations fees templates"
-                result = await ctx.deps.lightrag.aquery(query, param=QueryParam(mode="mix", top_k=6))
-                return f"**Distribution & Fees Templates:**\n{result}"
-            except Exception as e:
-                return f"Error retrieving distribution and fees templates: {str(e)}"
+            return await _retrieve(ctx.deps.lightrag, "distribution_and_fees_templates", jurisdiction=jurisdiction)
     
     def get_system_instructions(self) -> str:
         """Get PRS-specific system instructions"""
@@ -181,57 +290,29 @@ class PRSAgent(BaseFinancialAgent[PRSInput, PRSOutput, PRSAgentDeps]):
     
     def _format_user_prompt(self, input_data: PRSInput) -> str:
         """Format the user prompt for PRS document generation"""
-        return f"""
-        Generate a comprehensive Pricing Supplement for the following issuance. This document must
-        present final terms, pricing methodology, market data at pricing, settlement instructions,
-        and regulatory notices, and must cross-reference the Base Prospectus.
-
-        ## Reference Documents
-        - Base Prospectus: {input_data.base_prospectus_reference}
-        - Supplement Reference: {input_data.supplement_reference or 'Not applicable'}
-
-        ## Final Pricing Information
-        - Final Issue Price: {input_data.final_issue_price:.2f}% of principal
-        - Final Principal Amount: {input_data.final_principal_amount:,.2f} {input_data.currency}
-        - Currency: {input_data.currency}
-
-        ## Final Dates
-        - Pricing Date: {input_data.pricing_date.strftime('%B %d, %Y')}
-        - Issue Date: {input_data.issue_date.strftime('%B %d, %Y')}
-        - Maturity Date: {input_data.maturity_date.strftime('%B %d, %Y')}
-        - Settlement Date: {input_data.settlement_date.strftime('%B %d, %Y')}
-
-        ## Final Terms
-        - Final Coupon Rate: {input_data.final_coupon_rate if input_data.final_coupon_rate is not None else 'N/A'}
-        - Final Barrier Level: {input_data.final_barrier_level if input_data.final_barrier_level is not None else 'N/A'}
-        - Underlying Initial Level: {input_data.underlying_initial_level if input_data.underlying_initial_level is not None else 'TBD'}
-
-        ## Market Data at Pricing
-        - Underlying Price at Pricing: {input_data.underlying_price_at_pricing if input_data.underlying_price_at_pricing is not None else 'TBD'}
-        - Market Conditions: {input_data.market_conditions or 'Standard conditions'}
-        - Implied Volatility: {input_data.volatility_at_pricing if input_data.volatility_at_pricing is not None else 'TBD'}
-
-        ## Distribution & Fees
-        - Distribution Method: {input_data.distribution_method}
-        - Minimum Denomination: {input_data.minimum_denomination:,.2f}
-        - Agent Discount: {input_data.agent_discount if input_data.agent_discount is not None else 'N/A'}
-        - Estimated Value: {input_data.estimated_value if input_data.estimated_value is not None else 'TBD'}
-
-        ## REQUIRED TOOL USAGE
-        1. retrieve_base_prospectus(reference, section_keywords="summary risk factors pricing")
-        2. retrieve_pricing_methodology(product_type="{input_data.distribution_method}", underlying_asset="{input_data.currency}")  # NOTE: If product_type is needed, pass correct type instead of distribution
-        3. retrieve_market_data(underlying_asset="{input_data.distribution_method}", pricing_date="{input_data.pricing_date.strftime('%Y-%m-%d')}")  # NOTE: Replace placeholders with real underlying asset symbol/name
-        4. retrieve_regulatory_pricing_disclosures(jurisdiction="Canada")
-
-        ## OUTPUT REQUIREMENTS
-        Return a complete PRSOutput including: document_title, pricing_summary, document_references,
-        final_terms_summary, final_terms_table, pricing_methodology, estimated_value_explanation,
-        settlement_instructions, delivery_procedures, distribution_information, market_data_at_pricing,
-        fees_and_expenses, regulatory_notices, contact_information, additional_sections, document_version,
-        pricing_timestamp, and generation_date. Use formal, precise disclosure language.
-
-        Generation Date: {datetime.now().strftime('%Y-%m-%d')}
-        """
+        return _USER_PROMPT_TEMPLATE.format_map({
+            "base_prospectus_reference": input_data.base_prospectus_reference,
+            "supplement_reference": input_data.supplement_reference or 'Not applicable',
+            "final_issue_price": input_data.final_issue_price_str,
+            "final_principal_amount": input_data.final_principal_amount_str,
+            "currency": input_data.currency,
+            "pricing_date": input_data.pricing_date_str,
+            "issue_date": input_data.issue_date_str,
+            "maturity_date": input_data.maturity_date_str,
+            "settlement_date": input_data.settlement_date_str,
+            "final_coupon_rate": _or_default(input_data.final_coupon_rate, 'N/A'),
+            "final_barrier_level": _or_default(input_data.final_barrier_level, 'N/A'),
+            "underlying_initial_level": _or_default(input_data.underlying_initial_level, 'TBD'),
+            "underlying_price_at_pricing": _or_default(input_data.underlying_price_at_pricing, 'TBD'),
+            "market_conditions": input_data.market_conditions or 'Standard conditions',
+            "volatility_at_pricing": _or_default(input_data.volatility_at_pricing, 'TBD'),
+            "distribution_method": input_data.distribution_method,
+            "minimum_denomination": input_data.minimum_denomination_str,
+            "agent_discount": _or_default(input_data.agent_discount, 'N/A'),
+            "estimated_value": _or_default(input_data.estimated_value, 'TBD'),
+            "pricing_date_iso": input_data.pricing_date_iso,
+            "generation_date": datetime.now().strftime('%Y-%m-%d'),
+        })
 
     async def propose_knowledge_update(self, feedback: str) -> str:
         """
@@ -4,8 +4,8 @@ Configuration settings for the PRS (Pricing Supplement) agent.
 TODO: Full implementation pending ISM agent completion.
 """
 
+from functools import lru_cache
 from pydantic import BaseModel, Field
-from typing import Dict, Any, List, Optional
 
 
 class PRSConfig(BaseModel):
@@ -31,7 +31,17 @@ class PRSConfig(BaseModel):
     
     # TODO: Add more PRS-specific configuration options
     
+    class Config:
+        # Read-only so the shared default instance can be handed to every caller
+        frozen = True
+        extra = "forbid"
+    
     @classmethod
+    @lru_cache(maxsize=None)
     def get_default_config(cls) -> "PRSConfig":
-        """Get default configuration for PRS agent"""
+        """
+        Get default configuration for PRS agent.
+        
+        The instance is shared between callers; pass your own PRSConfig to customize it.
+        """
         return cls()
\ No newline at end of file
@@ -4,18 +4,161 @@ Document generator for PRS (Pricing Supplement) agent outputs.
 TODO: Full implementation pending ISM agent completion.
 """
 
+import hashlib
+import json
+import logging
 import os
+import re
+import threading
+import types
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, Dict, Any
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Mapping, Tuple
+from xml.sax.saxutils import escape as xml_escape
 try:
-    from docx import Document  # type: ignore
-except Exception:  # pragma: no cover - optional dependency in CI
-    Document = None  # type: ignore
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
 
 from .models import PRSOutput, PRSInput
 from .config import PRSConfig
 from core.config import global_config
 
+logger = logging.getLogger(__name__)
+
+
+# Bracketed placeholder tokens left unresolved in template text, e.g. "[Pricing Date]".
+# Deliberately not limited to the documented placeholder names: templates also carry
+# free-form markers such as "[Customized bullet point ...]" that must be caught too.
+_PLACEHOLDER_RE = re.compile(r"\[([^\[\]]+)\]")
+
+# Buffer size for TXT renderings so each file goes out in as few writes as possible
+_TXT_WRITE_BUFFER = 1 << 20
+
+
+# Canonical large-text sections in document order
+_ORDERED_SECTIONS: Tuple[str, ...] = (
+    "regulatory_and_offering_disclaimers",
+    "offering_overview",
+    "general_risks_and_guarantees",
+    "prospectus_and_capitalized_terms",
+    "documents_incorporated_by_reference",
+    "deferred_payment",
+    "forward_looking_statements",
+    "suitability_for_investment",
+    "appendix_c_certain_canadian_federal_income_tax_considerations",
+)
+# Headings that do not follow from the section key
+_TITLE_OVERRIDES: Mapping[str, str] = types.MappingProxyType({
+    "forward_looking_statements": "Forward-Looking Statements",
+    "appendix_c_certain_canadian_federal_income_tax_considerations": "Appendix C: Certain Canadian Federal Income Tax Considerations",
+})
+_TITLE_LOWERCASE_WORDS = frozenset({"and", "by", "for", "of", "the", "to", "in"})
+
+
+def _title_for(key: str) -> str:
+    """Heading for a canonical section key (e.g. "Documents Incorporated by Reference")"""
+    override = _TITLE_OVERRIDES.get(key)
+    if override:
+        return override
+    words = key.split("_")
+    return " ".join(
+        word if i and word in _TITLE_LOWERCASE_WORDS else word.capitalize()
+        for i, word in enumerate(words)
+    )
+
+
+# Headings for the canonical sections, computed once
+_SECTION_TITLES: Mapping[str, str] = types.MappingProxyType({key: _title_for(key) for key in _ORDERED_SECTIONS})
+
+
+def _materialize(document_sections: Dict[str, str]) -> List[Tuple[str, str]]:
+    """(heading, content) for each non-empty canonical section, in document order"""
+    return [
+        (_SECTION_TITLES[key], content)
+        for key in _ORDERED_SECTIONS
+        if (content := document_sections.get(key))
+    ]
+
+
+def _section_paragraphs(sections: List[Tuple[str, str]], title: Optional[str]) -> List[Tuple[str, Optional[str]]]:
+    """DOCX paragraphs for materialized sections, under an optional document title"""
+    paragraphs = [_heading(title, level=0)] if title else []
+    for section_title, content in sections:
+        paragraphs.append(_heading(section_title, level=1))
+        paragraphs.append((content, None))
+    return paragraphs
+
+
+def _sections_text(sections: List[Tuple[str, str]], title: Optional[str]) -> str:
+    """TXT rendering of materialized sections, under an optional document title"""
+    parts = [title + "\n\n"] if title else []
+    parts.extend(f"[{section_title}]\n{content.strip()}\n\n" for section_title, content in sections)
+    return "".join(parts)
+
+
+# Run content for DOCX paragraph text: tabs and line breaks become their own elements
+_RUN_BREAKS_RE = re.compile(r"(\t|\r|\n)")
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def _heading(text: str, level: int) -> Tuple[str, str]:
+    """Paragraph spec for a heading, styled like python-docx's add_heading"""
+    return text, "Title" if level == 0 else f"Heading{level}"
+
+
+def _paragraph_xml(text: str, style_id: Optional[str] = None) -> str:
+    """WordprocessingML for one paragraph, matching python-docx's add_paragraph output"""
+    ppr = f'<w:pPr><w:pStyle w:val="{style_id}"/></w:pPr>' if style_id else ""
+    if not text:
+        return f"<w:p>{ppr}</w:p>"
+    run = []
+    for piece in _RUN_BREAKS_RE.split(text):
+        if piece == "\t":
+            run.append("<w:tab/>")
+        elif piece in ("\r", "\n"):
+            run.append("<w:br/>")
+        elif piece:
+            space = ' xml:space="preserve"' if piece.strip() != piece else ""
+            run.append(f"<w:t{space}>{xml_escape(piece)}</w:t>")
+    return f"<w:p>{ppr}<w:r>{''.join(run)}</w:r></w:p>"
+
+
+def _append_paragraphs(doc: Any, paragraphs: List[Tuple[str, Optional[str]]]):
+    """
+    Append (text, style id) paragraphs to a DOCX body with a single XML parse.
+    
+    Building the body XML in one piece avoids the per-call element construction and
+    style lookups of python-docx's add_heading/add_paragraph.
+    """
+    from docx.oxml import parse_xml  # type: ignore
+    body_xml = "".join(_paragraph_xml(text, style_id) for text, style_id in paragraphs)
+    fragment = parse_xml(f'<w:body xmlns:w="{_W_NS}">{body_xml}</w:body>')
+    body = doc.element.body
+    sect_pr = body.sectPr
+    for paragraph in list(fragment):
+        if sect_pr is not None:
+            sect_pr.addprevious(paragraph)
+        else:
+            body.append(paragraph)
+
+
+def _save_docx(doc: Any, file_path: str):
+    """Serialize a DOCX document in memory and write it to disk in a single pass"""
+    buffer = BytesIO()
+    doc.save(buffer)
+    with open(file_path, "wb") as f:
+        f.write(buffer.getbuffer())
+
+
+def _dump_json(data: Dict[str, Any]) -> bytes:
+    """Encode a section map as indented UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
 
 class PRSDocumentGenerator:
     """
@@ -24,6 +167,17 @@ class PRSDocumentGenerator:
     TODO: Implement full document generator following ISM pattern.
     """
     
+    # python-docx Document class, resolved lazily by _document_class
+    _Document: Any = None
+    # Serialized empty document that _new_document loads instead of the default template
+    _template_bytes: Optional[bytes] = None
+    
+    # Placeholder validation results keyed by a digest of the validated sections (LRU)
+    _VALIDATION_CACHE_SIZE = 128
+    _validation_cache: "OrderedDict[bytes, Dict[str, list[str]]]" = OrderedDict()
+    # Shared by every instance and used from create_docx_batch worker threads
+    _validation_cache_lock = threading.Lock()
+    
     def __init__(self, config: Optional[PRSConfig] = None):
         """
         Initialize the document generator.
@@ -41,7 +195,8 @@ class PRSDocumentGenerator:
         self, 
         prs_output: PRSOutput, 
         input_data: PRSInput,
-        filename: Optional[str] = None
+        filename: Optional[str] = None,
+        now: Optional[datetime] = None
     ) -> str:
         """
         Create a formatted DOCX document from PRS output.
@@ -52,96 +207,251 @@ class PRSDocumentGenerator:
             prs_output: Structured output from PRS agent
             input_data: Original input data for context
             filename: Custom filename (optional)
+            now: Timestamp used in a generated filename (defaults to the current time)
             
         Returns:
             Path to the created document
         """
-        if Document is None:
-            raise RuntimeError("python-docx is required to create DOCX documents")
-        doc = Document()
-
-        # Title
-        doc.add_heading(prs_output.document_title, level=0)
-
-        # Pricing Summary
-        doc.add_heading("Pricing Summary", level=1)
-        doc.add_paragraph(prs_output.pricing_summary)
-
-        # Final Terms Table
-        doc.add_heading("Final Terms", level=1)
-        doc.add_paragraph(prs_output.final_terms_table)
-
-        # References
-        doc.add_heading("Document References", level=1)
-        doc.add_paragraph(prs_output.document_references)
-
-        # Pricing Methodology and Estimated Value
-        doc.add_heading("Pricing Methodology", level=1)
-        doc.add_paragraph(prs_output.pricing_methodology)
-        doc.add_heading("Estimated Value", level=2)
-        doc.add_paragraph(prs_output.estimated_value_explanation)
-
-        # Settlement and Delivery
-        doc.add_heading("Settlement Instructions", level=1)
-        doc.add_paragraph(prs_output.settlement_instructions)
-        doc.add_heading("Delivery Procedures", level=2)
-        doc.add_paragraph(prs_output.delivery_procedures)
-
-        # Distribution and Fees
-        doc.add_heading("Distribution Information", level=1)
-        doc.add_paragraph(prs_output.distribution_information)
-        doc.add_heading("Fees and Expenses", level=2)
-        doc.add_paragraph(prs_output.fees_and_expenses)
-
-        # Market Data
-        doc.add_heading("Market Data at Pricing", level=1)
-        doc.add_paragraph(prs_output.market_data_at_pricing)
-
-        # Regulatory Notices
-        doc.add_heading("Regulatory Notices", level=1)
-        doc.add_paragraph(prs_output.regulatory_notices)
+        return self.create_docx_batch([(prs_output, input_data, filename)], now=now)[0]
+    
+    def create_docx_batch(
+        self,
+        items: List[Tuple[PRSOutput, PRSInput, Optional[str]]],
+        max_workers: Optional[int] = None,
+        now: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Create formatted DOCX documents for several PRS outputs in one session.
+        
+        Documents are built in order and then saved concurrently; saving is dominated
+        by zip compression, which releases the GIL.
+        
+        Args:
+            items: (prs_output, input_data, filename) tuples; filename may be None
+            max_workers: Maximum number of concurrent saves (defaults to the CPU count)
+            now: Timestamp used in generated filenames (defaults to the current time)
+            
+        Returns:
+            Paths to the created documents, in the same order as items
+        """
+        self._document_class()
+        
+        # Check the output directory once for the whole batch
+        os.makedirs(self.output_dir, exist_ok=True)
+        
+        jobs = [
+            (self._build_docx(self._new_document(), prs_output), file_path)
+            for (prs_output, _, _), file_path in zip(items, self._docx_paths(items, now))
+        ]
+        
+        # Save documents
+        if len(jobs) == 1:
+            doc, file_path = jobs[0]
+            _save_docx(doc, file_path)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+                list(executor.map(lambda job: _save_docx(*job), jobs))
+        
+        file_paths = [file_path for _, file_path in jobs]
+        for file_path in file_paths:
+            logger.info("PRS document saved to: %s", file_path)
+        return file_paths
+    
+    def create_docx_batch_parallel(
+        self,
+        items: List[Tuple[PRSOutput, PRSInput, Optional[str]]],
+        max_workers: Optional[int] = None,
+        now: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Create formatted DOCX documents for several PRS outputs using worker processes.
+        
+        Building and serializing a document is CPU-bound in lxml and zipfile, so large
+        batches scale across cores; outputs are passed to the workers as JSON.
+        
+        Args:
+            items: (prs_output, input_data, filename) tuples; filename may be None
+            max_workers: Maximum number of worker processes (defaults to the CPU count)
+            now: Timestamp used in generated filenames (defaults to the current time)
+            
+        Returns:
+            Paths to the created documents, in the same order as items
+        """
+        self._document_class()
+        os.makedirs(self.output_dir, exist_ok=True)
+        
+        outputs_json = [prs_output.model_dump_json() for prs_output, _, _ in items]
+        paths = self._docx_paths(items, now)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            file_paths = list(executor.map(_render_one, outputs_json, paths))
+        
+        for file_path in file_paths:
+            logger.info("PRS document saved to: %s", file_path)
+        return file_paths
+    
+    def _docx_paths(
+        self,
+        items: List[Tuple[PRSOutput, PRSInput, Optional[str]]],
+        now: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Output paths for a batch, generating missing filenames from one timestamp.
+        
+        Documents are saved concurrently, so every path must be unique: generated names
+        that repeat get a numeric suffix, and repeated explicit filenames are rejected.
+        """
+        prefix = os.path.join(self.output_dir, "")
+        used = set()
+        for _, _, filename in items:
+            if filename:
+                if filename in used:
+                    raise ValueError(f"Duplicate DOCX filename in batch: {filename}")
+                used.add(filename)
+        
+        time_str = None
+        paths = []
+        for _, input_data, filename in items:
+            if not filename:
+                if time_str is None:
+                    time_str = (now or datetime.now()).strftime('%H%M')
+                stem = f"PRS_{input_data.pricing_date_compact}_{time_str}"
+                filename = f"{stem}.docx"
+                suffix = 1
+                while filename in used:
+                    suffix += 1
+                    filename = f"{stem}_{suffix}.docx"
+                used.add(filename)
+            paths.append(prefix + filename)
+        return paths
+    
+    @classmethod
+    def _document_class(cls) -> Any:
+        """Import python-docx on first use, so non-DOCX outputs do not pay for it"""
+        if cls._Document is None:
+            try:
+                from docx import Document  # type: ignore
+            except ImportError as e:  # pragma: no cover - optional dependency in CI
+                raise RuntimeError("python-docx is required to create DOCX documents") from e
+            cls._Document = Document
+        return cls._Document
+    
+    @classmethod
+    def _new_document(cls) -> Any:
+        """Create an empty DOCX document from a skeleton serialized once per process"""
+        document_class = cls._document_class()
+        if cls._template_bytes is None:
+            buffer = BytesIO()
+            document_class().save(buffer)
+            cls._template_bytes = buffer.getvalue()
+        return document_class(BytesIO(cls._template_bytes))
+    
+    @staticmethod
+    def _build_docx(doc: Any, prs_output: PRSOutput) -> Any:
+        """Fill an empty DOCX document with the content of a PRS output"""
+        paragraphs = [
+            # Title
+            _heading(prs_output.document_title, level=0),
+
+            # Pricing Summary
+            _heading("Pricing Summary", level=1),
+            (prs_output.pricing_summary, None),
+
+            # Final Terms Table
+            _heading("Final Terms", level=1),
+            (prs_output.final_terms_table, None),
+
+            # References
+            _heading("Document References", level=1),
+            (prs_output.document_references, None),
+
+            # Pricing Methodology and Estimated Value
+            _heading("Pricing Methodology", level=1),
+            (prs_output.pricing_methodology, None),
+            _heading("Estimated Value", level=2),
+            (prs_output.estimated_value_explanation, None),
+
+            # Settlement and Delivery
+            _heading("Settlement Instructions", level=1),
+            (prs_output.settlement_instructions, None),
+            _heading("Delivery Procedures", level=2),
+            (prs_output.delivery_procedures, None),
+
+            # Distribution and Fees
+            _heading("Distribution Information", level=1),
+            (prs_output.distribution_information, None),
+            _heading("Fees and Expenses", level=2),
+            (prs_output.fees_and_expenses, None),
+
+            # Market Data
+            _heading("Market Data at Pricing", level=1),
+            (prs_output.market_data_at_pricing, None),
+
+            # Regulatory Notices
+            _heading("Regulatory Notices", level=1),
+            (prs_output.regulatory_notices, None),
+        ]
 
         # Additional Sections
         if prs_output.additional_sections:
             for section_name, section_text in prs_output.additional_sections.items():
-                doc.add_heading(section_name.replace('_', ' ').title(), level=1)
-                doc.add_paragraph(section_text)
+                paragraphs.append(_heading(section_name.replace('_', ' ').title(), level=1))
+                paragraphs.append((section_text, None))
 
         # Footer metadata
-        doc.add_paragraph("")
-        doc.add_paragraph(f"Document Version: {prs_output.document_version}")
-        doc.add_paragraph(f"Generation Date: {prs_output.generation_date}")
-        doc.add_paragraph(f"Pricing Timestamp: {prs_output.pricing_timestamp}")
-        
-        # Generate filename if not provided
-        if not filename:
-            pricing_date_str = input_data.pricing_date.strftime('%Y%m%d')
-            filename = f"PRS_{pricing_date_str}_{datetime.now().strftime('%H%M')}.docx"
-        
-        # Save document
-        file_path = os.path.join(self.output_dir, filename)
-        doc.save(file_path)
-        
-        print(f"PRS document saved to: {file_path}")
-        return file_path
+        paragraphs.extend([
+            ("", None),
+            (f"Document Version: {prs_output.document_version}", None),
+            (f"Generation Date: {prs_output.generation_date}", None),
+            (f"Pricing Timestamp: {prs_output.pricing_timestamp}", None),
+        ])
+        _append_paragraphs(doc, paragraphs)
+        return doc
 
     # ---------------------------------------------------------------------
     # Large Text Templates Rendering (optional flow directly from templates)
     # ---------------------------------------------------------------------
     @staticmethod
     def _extract_unresolved_placeholders(text: str) -> list[str]:
-        import re
-        pattern = re.compile(r"\[([^\[\]]+)\]")
-        return pattern.findall(text or "")
+        # Most sections have no brackets at all; a substring test is far cheaper than a regex scan
+        if not text or "[" not in text:
+            return []
+        return _PLACEHOLDER_RE.findall(text)
 
     @classmethod
     def validate_no_unresolved_placeholders(cls, section_contents: Dict[str, str]) -> Dict[str, list[str]]:
-        unresolved: Dict[str, list[str]] = {}
-        for section_name, content in section_contents.items():
-            found = cls._extract_unresolved_placeholders(content)
-            if found:
-                unresolved[section_name] = sorted(set(found))
-        return unresolved
+        # Regenerating outputs from the same sections (retries, reformatting) reuses the scan
+        digest = hashlib.blake2b(digest_size=16)
+        for section_name, content in sorted(section_contents.items()):
+            digest.update(section_name.encode("utf-8") + b"\0" + (content or "").encode("utf-8") + b"\0")
+        key = digest.digest()
+
+        with cls._validation_cache_lock:
+            unresolved = cls._validation_cache.get(key)
+            if unresolved is not None:
+                cls._validation_cache.move_to_end(key)
+        if unresolved is None:
+            # Scan outside the lock; a concurrent scan of the same sections stores an equal result
+            unresolved = {}
+            for section_name, content in section_contents.items():
+                found = cls._extract_unresolved_placeholders(content)
+                if found:
+                    unresolved[section_name] = sorted(set(found))
+            with cls._validation_cache_lock:
+                cls._validation_cache[key] = unresolved
+                if len(cls._validation_cache) > cls._VALIDATION_CACHE_SIZE:
+                    cls._validation_cache.popitem(last=False)
+        return {section_name: list(missing) for section_name, missing in unresolved.items()}
+
+    @classmethod
+    def _raise_on_unresolved_placeholders(cls, document_sections: Dict[str, str]):
+        unresolved = cls.validate_no_unresolved_placeholders(document_sections)
+        if unresolved:
+            details = []
+            for section_name, missing in unresolved.items():
+                details.append(f"- {section_name}: {', '.join(missing)}")
+            raise ValueError(
+                "Unresolved placeholders detected in document sections.\n" + "\n".join(details)
+            )
 
     def create_docx_from_templates(
         self,
@@ -155,56 +465,17 @@ class PRSDocumentGenerator:
         Expected canonical keys follow agents.prs.large_text_templates.list_canonical_section_keys().
         """
         if enforce_placeholder_validation:
-            unresolved = self.validate_no_unresolved_placeholders(document_sections)
-            if unresolved:
-                details = []
-                for section_name, missing in unresolved.items():
-                    details.append(f"- {section_name}: {', '.join(missing)}")
-                raise ValueError(
-                    "Unresolved placeholders detected in document sections.\n" + "\n".join(details)
-                )
-
-        ordered_sections = [
-            "regulatory_and_offering_disclaimers",
-            "offering_overview",
-            "general_risks_and_guarantees",
-            "prospectus_and_capitalized_terms",
-            "documents_incorporated_by_reference",
-            "deferred_payment",
-            "forward_looking_statements",
-            "suitability_for_investment",
-            "appendix_c_certain_canadian_federal_income_tax_considerations",
-        ]
-        section_titles = {
-            "regulatory_and_offering_disclaimers": "Regulatory and Offering Disclaimers",
-            "offering_overview": "Offering Overview",
-            "general_risks_and_guarantees": "General Risks and Guarantees",
-            "prospectus_and_capitalized_terms": "Prospectus and Capitalized Terms",
-            "documents_incorporated_by_reference": "Documents Incorporated by Reference",
-            "deferred_payment": "Deferred Payment",
-            "forward_looking_statements": "Forward-Looking Statements",
-            "suitability_for_investment": "Suitability for Investment",
-            "appendix_c_certain_canadian_federal_income_tax_considerations": "Appendix C: Certain Canadian Federal Income Tax Considerations",
-        }
-
-        if Document is None:
-            raise RuntimeError("python-docx is required to create DOCX documents")
-        doc = Document()
-        if title:
-            doc.add_heading(title, level=0)
-        for section_key in ordered_sections:
-            content = document_sections.get(section_key)
-            if not content:
-                continue
-            doc.add_heading(section_titles[section_key], level=1)
-            doc.add_paragraph(content)
+            self._raise_on_unresolved_placeholders(document_sections)
+
+        doc = self._new_document()
+        _append_paragraphs(doc, _section_paragraphs(_materialize(document_sections), title))
 
         if not filename:
             filename = f"PRS_Templates_{datetime.now().strftime('%Y%m%d_%H%M%S')}.docx"
 
         file_path = os.path.join(self.output_dir, filename)
-        doc.save(file_path)
-        print(f"PRS templates document saved to: {file_path}")
+        _save_docx(doc, file_path)
+        logger.info("PRS templates document saved to: %s", file_path)
         return file_path
 
     def save_sections(
@@ -219,7 +490,6 @@ class PRSDocumentGenerator:
         If filename_stem is not provided, a timestamp-based default is used. Prefer passing
         the DOCX stem for consistent naming across formats.
         """
-        import json
         if not filename_stem:
             filename_stem = f"PRS_Templates_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
@@ -227,41 +497,56 @@ class PRSDocumentGenerator:
         txt_path = os.path.join(self.output_dir, f"{filename_stem}.txt")
 
         # JSON dump of section map
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(document_sections, f, ensure_ascii=False, indent=2)
-
-        ordered_sections = [
-            "regulatory_and_offering_disclaimers",
-            "offering_overview",
-            "general_risks_and_guarantees",
-            "prospectus_and_capitalized_terms",
-            "documents_incorporated_by_reference",
-            "deferred_payment",
-            "forward_looking_statements",
-            "suitability_for_investment",
-            "appendix_c_certain_canadian_federal_income_tax_considerations",
-        ]
-        section_titles = {
-            "regulatory_and_offering_disclaimers": "Regulatory and Offering Disclaimers",
-            "offering_overview": "Offering Overview",
-            "general_risks_and_guarantees": "General Risks and Guarantees",
-            "prospectus_and_capitalized_terms": "Prospectus and Capitalized Terms",
-            "documents_incorporated_by_reference": "Documents Incorporated by Reference",
-            "deferred_payment": "Deferred Payment",
-            "forward_looking_statements": "Forward-Looking Statements",
-            "suitability_for_investment": "Suitability for Investment",
-            "appendix_c_certain_canadian_federal_income_tax_considerations": "Appendix C: Certain Canadian Federal Income Tax Considerations",
-        }
-
-        # TXT rendering
-        with open(txt_path, "w", encoding="utf-8") as f:
-            if title:
-                f.write(title + "\n\n")
-            for key in ordered_sections:
-                content = document_sections.get(key)
-                if not content:
-                    continue
-                f.write(f"[{section_titles[key]}]\n")
-                f.write(content.strip() + "\n\n")
-
-        return {"json_path": json_path, "txt_path": txt_path}
\ No newline at end of file
+        with open(json_path, "wb") as f:
+            f.write(_dump_json(document_sections))
+
+        # TXT rendering, assembled in memory and written in one call
+        with open(txt_path, "w", encoding="utf-8", buffering=_TXT_WRITE_BUFFER) as f:
+            f.write(_sections_text(_materialize(document_sections), title))
+
+        return {"json_path": json_path, "txt_path": txt_path}
+
+    def create_all_outputs(
+        self,
+        document_sections: Dict[str, str],
+        filename_stem: Optional[str] = None,
+        title: Optional[str] = None,
+        enforce_placeholder_validation: bool = True,
+    ) -> Dict[str, str]:
+        """
+        Create the DOCX, JSON and TXT outputs for PRS large-text sections in one pass.
+
+        Equivalent to create_docx_from_templates followed by save_sections with the same
+        stem and title, but looks up the canonical sections only once for both renderings.
+        """
+        if enforce_placeholder_validation:
+            self._raise_on_unresolved_placeholders(document_sections)
+
+        self._document_class()
+        if not filename_stem:
+            filename_stem = f"PRS_Templates_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+        docx_path = os.path.join(self.output_dir, f"{filename_stem}.docx")
+        json_path = os.path.join(self.output_dir, f"{filename_stem}.json")
+        txt_path = os.path.join(self.output_dir, f"{filename_stem}.txt")
+
+        sections = _materialize(document_sections)
+
+        doc = self._new_document()
+        _append_paragraphs(doc, _section_paragraphs(sections, title))
+        _save_docx(doc, docx_path)
+        with open(json_path, "wb") as f:
+            f.write(_dump_json(document_sections))
+        with open(txt_path, "w", encoding="utf-8", buffering=_TXT_WRITE_BUFFER) as f:
+            f.write(_sections_text(sections, title))
+
+        logger.info("PRS templates document saved to: %s", docx_path)
+        return {"docx_path": docx_path, "json_path": json_path, "txt_path": txt_path}
+
+
+def _render_one(prs_output_json: str, file_path: str) -> str:
+    """Build and save one PRS document; module-level so worker processes can run it"""
+    prs_output = PRSOutput.model_validate_json(prs_output_json)
+    doc = PRSDocumentGenerator._build_docx(PRSDocumentGenerator._new_document(), prs_output)
+    _save_docx(doc, file_path)
+    return file_path
@@ -2,19 +2,12 @@
 Instructions and prompts for the PRS (Pricing Supplement) agent.
 """
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 
-class PRSInstructions:
-    """
-    Contains all instruction templates and prompts for the PRS agent.
-    Mirrors ISM’s structure with PRS-specific focus on final terms,
-    pricing methodology, estimated value, distribution/fees, and settlement.
-    """
-
-    def get_base_instructions(self) -> str:
-        """Base system instructions for PRS agent"""
-        return """
+# Instruction text is constant, so it is built once at import and shared by all instances
+_BASE_INSTRUCTIONS = """
         You generate Pricing Supplements for structured note issuances. Your document sets out
         the final terms, pricing methodology, market data at pricing, estimated value, distribution
         and fees, and settlement instructions. It must cross-reference the Base Shelf Prospectus
@@ -68,48 +61,65 @@ class PRSInstructions:
         7) retrieve_regulatory_pricing_disclosures for jurisdiction-specific notices
         """
 
+_PRODUCT_TYPE_INSTRUCTIONS: Mapping[str, str] = MappingProxyType({
+    "autocallable": (
+        "- Include observation/call schedule alignment with final dates\n"
+        "- State barrier/trigger levels and how they affect redemption/coupon\n"
+        "- Clarify memory feature, if any, and coupon accrual rules"
+    ),
+    "barrier": (
+        "- State barrier definition (KI/KO) and measurement conventions\n"
+        "- Explain effect at maturity given barrier breach or not\n"
+        "- Provide final barrier and initial level precisely"
+    ),
+    "reverse_convertible": (
+        "- Clarify conversion mechanics and delivery vs cash\n"
+        "- State high coupon rationale and downside risk\n"
+        "- Provide trigger/strike references and day-count basis"
+    ),
+})
+_DEFAULT_PRODUCT_TYPE_INSTRUCTIONS = "- Provide concise final-term mechanics and triggers."
+
+_AUDIENCE_INSTRUCTIONS: Mapping[str, str] = MappingProxyType({
+    "institutional": "- Assume familiarity; focus on precision and references.",
+    "retail": "- Keep terminology defined; avoid jargon; keep tables clear.",
+})
+
+_SECTION_FORMATTING_REQUIREMENTS: Mapping[str, str] = MappingProxyType({
+    "document_title": "Format: 'Pricing Supplement - [Series] - [Underlying] - [Pricing Date]'",
+    "pricing_summary": "1-2 paragraphs; include final price %, principal, currency, and key dates.",
+    "final_terms_summary": "Bulleted list: coupon/fixed return, barriers/levels, day-count, business day convention.",
+    "final_terms_table": "Tabular text block with aligned key-value pairs for all final terms.",
+    "pricing_methodology": "Narrative steps + inputs (curve, vol, spread, fees assumptions).",
+    "estimated_value_explanation": "Standard language explaining estimated value and drivers (fees, hedging, funding).",
+    "settlement_instructions": "Clear steps incl. depository, CUSIP/ISIN if available, and timeline.",
+    "distribution_information": "Channels, selling restrictions legend, denominations and multiples.",
+    "fees_and_expenses": "Breakdown: agent discount, structuring fee, any third-party fees.",
+    "regulatory_notices": "Jurisdiction-specific notices in 'Important Notice:' format.",
+    "contact_information": "Issuer/agent phone/email/website; hours if applicable.",
+    "market_data_at_pricing": "Underlying price, vol (if applicable), brief conditions sentence.",
+})
+
+
+class PRSInstructions:
+    """
+    Contains all instruction templates and prompts for the PRS agent.
+    Mirrors ISM’s structure with PRS-specific focus on final terms,
+    pricing methodology, estimated value, distribution/fees, and settlement.
+    """
+
+    def get_base_instructions(self) -> str:
+        """Base system instructions for PRS agent"""
+        return _BASE_INSTRUCTIONS
+
     def get_product_type_instructions(self, product_type: str) -> str:
         """PRS product-type specifics (concise, doc-oriented)"""
-        mapping = {
-            "autocallable": (
-                "- Include observation/call schedule alignment with final dates\n"
-                "- State barrier/trigger levels and how they affect redemption/coupon\n"
-                "- Clarify memory feature, if any, and coupon accrual rules"
-            ),
-            "barrier": (
-                "- State barrier definition (KI/KO) and measurement conventions\n"
-                "- Explain effect at maturity given barrier breach or not\n"
-                "- Provide final barrier and initial level precisely"
-            ),
-            "reverse_convertible": (
-                "- Clarify conversion mechanics and delivery vs cash\n"
-                "- State high coupon rationale and downside risk\n"
-                "- Provide trigger/strike references and day-count basis"
-            ),
-        }
-        return mapping.get(product_type.lower(), "- Provide concise final-term mechanics and triggers.")
+        return _PRODUCT_TYPE_INSTRUCTIONS.get(product_type.lower(), _DEFAULT_PRODUCT_TYPE_INSTRUCTIONS)
 
     def get_audience_specific_instructions(self, audience: str) -> str:
         """Audience nuance—kept minimal for PRS (primarily professional readers)"""
-        mapping = {
-            "institutional": "- Assume familiarity; focus on precision and references.",
-            "retail": "- Keep terminology defined; avoid jargon; keep tables clear.",
-        }
-        return mapping.get(audience.lower(), mapping["institutional"])
+        return _AUDIENCE_INSTRUCTIONS.get(audience.lower(), _AUDIENCE_INSTRUCTIONS["institutional"])
 
-    def get_section_formatting_requirements(self) -> Dict[str, str]:
+    def get_section_formatting_requirements(self) -> Mapping[str, str]:
         """Section formats to drive consistent, verifiable outputs"""
-        return {
-            "document_title": "Format: 'Pricing Supplement - [Series] - [Underlying] - [Pricing Date]'",
-            "pricing_summary": "1-2 paragraphs; include final price %, principal, currency, and key dates.",
-            "final_terms_summary": "Bulleted list: coupon/fixed return, barriers/levels, day-count, business day convention.",
-            "final_terms_table": "Tabular text block with aligned key-value pairs for all final terms.",
-            "pricing_methodology": "Narrative steps + inputs (curve, vol, spread, fees assumptions).",
-            "estimated_value_explanation": "Standard language explaining estimated value and drivers (fees, hedging, funding).",
-            "settlement_instructions": "Clear steps incl. depository, CUSIP/ISIN if available, and timeline.",
-            "distribution_information": "Channels, selling restrictions legend, denominations and multiples.",
-            "fees_and_expenses": "Breakdown: agent discount, structuring fee, any third-party fees.",
-            "regulatory_notices": "Jurisdiction-specific notices in 'Important Notice:' format.",
-            "contact_information": "Issuer/agent phone/email/website; hours if applicable.",
-            "market_data_at_pricing": "Underlying price, vol (if applicable), brief conditions sentence.",
-        }
\ No newline at end of file
+        return _SECTION_FORMATTING_REQUIREMENTS
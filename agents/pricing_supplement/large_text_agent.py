@@ -5,22 +5,120 @@ This module provides the PRS-specific implementation of the large text agent
 that extends the base mixin with PRS-specific template handling and field mapping.
 """
 
-from typing import Dict, Any, Optional, List
+import asyncio
+import functools
+import logging
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 from agents.core.large_text_mixin import LargeTextAgentMixin
-from .models import PRSInput, PRSOutput
+from .models import DISPLAY_DATE_FORMAT, PRSInput, PRSOutput
 from .document_generator import PRSDocumentGenerator
+from . import large_text_templates
 import os
+import re
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+# Final terms summary; optional coupon/barrier parts carry their own separator
+_FINAL_TERMS_SUMMARY = (
+    "Issue Price: {input_data.final_issue_price_str}% of principal; "
+    "Principal Amount: {input_data.final_principal_amount_rounded_str} {input_data.currency}; "
+    "Pricing Date: {input_data.pricing_date_str}; "
+    "Issue Date: {input_data.issue_date_str}; "
+    "Maturity Date: {input_data.maturity_date_str}; "
+    "Settlement Date: {input_data.settlement_date_str}"
+)
+_FINAL_TERMS_SUMMARY_COUPON = "; Coupon: {:.2f}%"
+_FINAL_TERMS_SUMMARY_BARRIER = "; Barrier: {:.2f}%"
+
+# Final terms table layout; each row template ends with the newline that joins it to the next.
+# Labels are pre-padded literals, so only the value cells are padded at render time,
+# within the same format_map pass (round-tripping through bytes would cost more).
+_FINAL_TERMS_TABLE_BODY = (
+    "┌─────────────────────────────┬─────────────────────────────────┐\n"
+    "│ Term                        │ Value                           │\n"
+    "├─────────────────────────────┼─────────────────────────────────┤\n"
+    "│ Final Issue Price           │ {final_issue_price}% of principal       │\n"
+    "│ Final Principal Amount      │ {final_principal_amount} {currency:<11} │\n"
+    "│ Pricing Date                │ {pricing_date:<29} │\n"
+    "│ Issue Date                  │ {issue_date:<29} │\n"
+    "│ Maturity Date               │ {maturity_date:<29} │\n"
+    "│ Settlement Date             │ {settlement_date:<29} │\n"
+)
+_FINAL_TERMS_COUPON_ROW = "│ Final Coupon Rate           │ {:.2f}%                       │\n"
+_FINAL_TERMS_BARRIER_ROW = "│ Final Barrier Level         │ {:.2f}%                      │\n"
+_FINAL_TERMS_TABLE_FOOTER = "└─────────────────────────────┴─────────────────────────────────┘"
+
+_CONTACT_INFORMATION = (
+    "• Phone: 1-866-416-7891\n"
+    "• Email: structured.products@scotiabank.com\n"
+    "• Website: www.scotiabank.com/structuredproducts"
+)
+
+# Section-derived mapping fields when the rendered document has no content
+_EMPTY_DOCUMENT_FIELDS = MappingProxyType({
+    "pricing_summary": "Pricing Summary is available in the full document.",
+    "document_references": "Document references are available in the full document.",
+    "regulatory_notices": "Regulatory notices are available in the full document.",
+    "additional_sections": None,
+})
+
+# Canonical legal sections carried into PRSOutput.additional_sections
+_ADDITIONAL_SECTION_KEYS = (
+    "regulatory_and_offering_disclaimers",
+    "documents_incorporated_by_reference",
+    "forward_looking_statements",
+    "suitability_for_investment",
+    "deferred_payment",
+)
+
+# Fallback values shared by every variable that uses them
+_NOT_APPLICABLE = "Not applicable"
+_TO_BE_DETERMINED = "To be determined"
+
+# Numeric template variables as (label, PRSInput field, format spec, fallback).
+# Optional fields that are unset or zero render as their fallback; a None
+# fallback marks a required field that is always formatted.
+_NUMERIC_VARIABLES = (
+    ("Final Issue Price", "final_issue_price", "{:.2f}", None),
+    ("Final Principal Amount", "final_principal_amount", "{:,.0f}", None),
+    ("Final Coupon Rate", "final_coupon_rate", "{:.2f}", _NOT_APPLICABLE),
+    ("Final Barrier Level", "final_barrier_level", "{:.2f}", _NOT_APPLICABLE),
+    ("Underlying Initial Level", "underlying_initial_level", "{:,.2f}", _TO_BE_DETERMINED),
+    ("Underlying Price at Pricing", "underlying_price_at_pricing", "{:,.2f}", _TO_BE_DETERMINED),
+    ("Volatility at Pricing", "volatility_at_pricing", "{:.1f}", _TO_BE_DETERMINED),
+    ("Minimum Denomination", "minimum_denomination", "{:,.0f}", None),
+    ("Agent Discount", "agent_discount", "{:.2f}", _NOT_APPLICABLE),
+    ("Estimated Value", "estimated_value", "{:.2f}", _TO_BE_DETERMINED),
+)
+
+# Whole lines mentioning "regulatory" in any case (this also covers the
+# "No securities regulatory authority" notice)
+_REGULATORY_LINE_RE = re.compile(r"^.*regulatory.*$", re.IGNORECASE | re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=64)
+def _additional_terms_template(keys: Tuple[Any, ...]) -> str:
+    """Build the "key: value; ..." format string for one additional-terms key layout"""
+    return "; ".join(str(key).replace("{", "{{").replace("}", "}}") + ": {}" for key in keys)
 
 
 class LargeTextPRSAgent(LargeTextAgentMixin[PRSInput, PRSOutput]):
     """PRS agent with large text template support"""
     
+    def __init__(self, base_agent, config=None):
+        super().__init__(base_agent, config)
+        # Mapping fields that are the same for every document
+        self._static_fields = {
+            "document_version": "1.0",
+            "contact_information": _CONTACT_INFORMATION,
+        }
+    
     def _get_agent_type(self) -> str:
         return "prs"
     
     def _get_template_module(self):
-        from . import large_text_templates
         return large_text_templates
     
     def _get_output_model(self):
@@ -31,54 +129,55 @@ class LargeTextPRSAgent(LargeTextAgentMixin[PRSInput, PRSOutput]):
     
     def _extract_agent_specific_variables(self, input_data: PRSInput) -> Dict[str, str]:
         """Extract PRS-specific variables from input data"""
-        return {
+        # One clock read so both header dates describe the same instant;
+        # input dates come pre-formatted (and cached) from PRSInput
+        now = datetime.now()
+        variables = {
             # ===== DOCUMENT HEADER =====
-            "Document Date": datetime.now().strftime("%B %d, %Y"),
-            "Generation Date": datetime.now().strftime('%Y-%m-%d'),
+            "Document Date": now.strftime(DISPLAY_DATE_FORMAT),
+            "Generation Date": now.strftime('%Y-%m-%d'),
             
             # ===== REFERENCE DOCUMENTS =====
             "Base Prospectus Reference": input_data.base_prospectus_reference,
-            "Supplement Reference": input_data.supplement_reference or "Not applicable",
-            
-            # ===== FINAL PRICING INFORMATION =====
-            "Final Issue Price": f"{input_data.final_issue_price:.2f}",
-            "Final Principal Amount": f"{input_data.final_principal_amount:,.0f}",
+            "Supplement Reference": input_data.supplement_reference or _NOT_APPLICABLE,
             "Currency": input_data.currency,
             
             # ===== FINAL DATES =====
-            "Pricing Date": input_data.pricing_date.strftime("%B %d, %Y"),
-            "Issue Date": input_data.issue_date.strftime("%B %d, %Y"),
-            "Maturity Date": input_data.maturity_date.strftime("%B %d, %Y"),
-            "Settlement Date": input_data.settlement_date.strftime("%B %d, %Y"),
-            
-            # ===== FINAL TERMS =====
-            "Final Coupon Rate": f"{input_data.final_coupon_rate:.2f}" if input_data.final_coupon_rate else "Not applicable",
-            "Final Barrier Level": f"{input_data.final_barrier_level:.2f}" if input_data.final_barrier_level else "Not applicable",
-            "Underlying Initial Level": f"{input_data.underlying_initial_level:,.2f}" if input_data.underlying_initial_level else "To be determined",
+            "Pricing Date": input_data.pricing_date_str,
+            "Issue Date": input_data.issue_date_str,
+            "Maturity Date": input_data.maturity_date_str,
+            "Settlement Date": input_data.settlement_date_str,
             
-            # ===== MARKET DATA =====
-            "Underlying Price at Pricing": f"{input_data.underlying_price_at_pricing:,.2f}" if input_data.underlying_price_at_pricing else "To be determined",
+            # ===== TEXT TERMS =====
             "Market Conditions": input_data.market_conditions or "Standard market conditions",
-            "Volatility at Pricing": f"{input_data.volatility_at_pricing:.1f}" if input_data.volatility_at_pricing else "To be determined",
-            
-            # ===== DISTRIBUTION INFORMATION =====
             "Distribution Method": input_data.distribution_method,
-            "Minimum Denomination": f"{input_data.minimum_denomination:,.0f}",
-            
-            # ===== FEES AND EXPENSES =====
-            "Agent Discount": f"{input_data.agent_discount:.2f}" if input_data.agent_discount else "Not applicable",
-            "Estimated Value": f"{input_data.estimated_value:.2f}" if input_data.estimated_value else "To be determined",
-            
-            # ===== ADDITIONAL FINAL TERMS =====
             "Additional Terms": self._format_additional_terms(input_data.additional_terms),
         }
+        # Formatted eagerly: the mixin merges these into one dict and
+        # customize_template walks every entry, so a lazy mapping would save nothing
+        for label, field, spec, fallback in _NUMERIC_VARIABLES:
+            value = getattr(input_data, field)
+            variables[label] = spec.format(value) if value or fallback is None else fallback
+        return variables
     
     def _create_field_mapping(self, doc_dict: Dict[str, str], input_data: PRSInput) -> Dict[str, Any]:
         """Map PRS template sections to PRSOutput fields using canonical keys"""
+        # Single clock read keeps the timestamp and generation date consistent
+        pricing_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        if doc_dict:
+            document_fields = {
+                "pricing_summary": self._extract_pricing_summary(doc_dict),
+                "document_references": self._extract_document_references(doc_dict),
+                "regulatory_notices": self._extract_regulatory_notices(doc_dict),
+                "additional_sections": self._extract_additional_sections(doc_dict),
+            }
+        else:
+            # Nothing was rendered, so every section-derived field takes its default
+            document_fields = _EMPTY_DOCUMENT_FIELDS
         return {
+            **self._static_fields,
+            **document_fields,
             "document_title": self._create_document_title(input_data),
-            "pricing_summary": self._extract_pricing_summary(doc_dict),
-            "document_references": self._extract_document_references(doc_dict),
             "final_terms_summary": self._extract_final_terms_summary_from_input(input_data),
             "final_terms_table": self._extract_final_terms_table_from_input(input_data),
             "pricing_methodology": self._extract_pricing_methodology(doc_dict, input_data),
@@ -88,67 +187,54 @@ class LargeTextPRSAgent(LargeTextAgentMixin[PRSInput, PRSOutput]):
             "distribution_information": self._extract_distribution_information(input_data),
             "market_data_at_pricing": self._extract_market_data_at_pricing(doc_dict, input_data),
             "fees_and_expenses": self._extract_fees_and_expenses(input_data),
-            "regulatory_notices": self._extract_regulatory_notices(doc_dict),
-            "contact_information": self._create_contact_information(),
-            "additional_sections": self._extract_additional_sections(doc_dict),
-            "document_version": "1.0",
-            "pricing_timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            "generation_date": datetime.now().strftime('%Y-%m-%d')
+            "pricing_timestamp": pricing_timestamp,
+            "generation_date": pricing_timestamp[:10],
         }
     
     # PRS-specific extraction methods
     def _create_document_title(self, input_data: PRSInput) -> str:
         """Create document title in required format"""
-        return f"Pricing Supplement - {input_data.pricing_date.strftime('%Y%m%d')}"
+        return f"Pricing Supplement - {input_data.pricing_date_compact}"
     
     def _extract_pricing_summary(self, doc_dict: Dict[str, str]) -> str:
         """Use offering overview as pricing summary"""
-        return self._extract_text_field(doc_dict, "offering_overview", "Pricing Summary is available in the full document.")
+        return self._extract_text_field(doc_dict, "offering_overview", _EMPTY_DOCUMENT_FIELDS["pricing_summary"])
     
     def _extract_document_references(self, doc_dict: Dict[str, str]) -> str:
         """Combine prospectus/capitalized terms and documents incorporated sections"""
-        parts = [
-            self._extract_text_field(doc_dict, "prospectus_and_capitalized_terms", ""),
-            self._extract_text_field(doc_dict, "documents_incorporated_by_reference", ""),
-        ]
-        combined = "\n\n".join([p.strip() for p in parts if p.strip()])
-        return combined or "Document references are available in the full document."
+        get = self._extract_text_field
+        parts = (
+            get(doc_dict, "prospectus_and_capitalized_terms", "").strip(),
+            get(doc_dict, "documents_incorporated_by_reference", "").strip(),
+        )
+        combined = "\n\n".join(filter(None, parts))
+        return combined or _EMPTY_DOCUMENT_FIELDS["document_references"]
     
     def _extract_final_terms_summary_from_input(self, input_data: PRSInput) -> str:
         """Synthesize a concise final terms summary directly from input data"""
-        parts = [
-            f"Issue Price: {input_data.final_issue_price:.2f}% of principal",
-            f"Principal Amount: {input_data.final_principal_amount:,.0f} {input_data.currency}",
-            f"Pricing Date: {input_data.pricing_date.strftime('%B %d, %Y')}",
-            f"Issue Date: {input_data.issue_date.strftime('%B %d, %Y')}",
-            f"Maturity Date: {input_data.maturity_date.strftime('%B %d, %Y')}",
-            f"Settlement Date: {input_data.settlement_date.strftime('%B %d, %Y')}",
-        ]
+        summary = _FINAL_TERMS_SUMMARY.format(input_data=input_data)
         if input_data.final_coupon_rate is not None:
-            parts.append(f"Coupon: {input_data.final_coupon_rate:.2f}%")
+            summary += _FINAL_TERMS_SUMMARY_COUPON.format(input_data.final_coupon_rate)
         if input_data.final_barrier_level is not None:
-            parts.append(f"Barrier: {input_data.final_barrier_level:.2f}%")
-        return "; ".join(parts)
+            summary += _FINAL_TERMS_SUMMARY_BARRIER.format(input_data.final_barrier_level)
+        return summary
     
     def _extract_final_terms_table_from_input(self, input_data: PRSInput) -> str:
         """Create a fixed-width table of final terms from input data"""
-        table_lines = [
-            "┌─────────────────────────────┬─────────────────────────────────┐",
-            "│ Term                        │ Value                           │",
-            "├─────────────────────────────┼─────────────────────────────────┤",
-            f"│ Final Issue Price           │ {input_data.final_issue_price:.2f}% of principal       │",
-            f"│ Final Principal Amount      │ {input_data.final_principal_amount:,.0f} {input_data.currency:<11} │",
-            f"│ Pricing Date                │ {input_data.pricing_date.strftime('%B %d, %Y'):<29} │",
-            f"│ Issue Date                  │ {input_data.issue_date.strftime('%B %d, %Y'):<29} │",
-            f"│ Maturity Date               │ {input_data.maturity_date.strftime('%B %d, %Y'):<29} │",
-            f"│ Settlement Date             │ {input_data.settlement_date.strftime('%B %d, %Y'):<29} │",
-        ]
+        table = _FINAL_TERMS_TABLE_BODY.format_map({
+            "final_issue_price": input_data.final_issue_price_str,
+            "final_principal_amount": input_data.final_principal_amount_rounded_str,
+            "currency": input_data.currency,
+            "pricing_date": input_data.pricing_date_str,
+            "issue_date": input_data.issue_date_str,
+            "maturity_date": input_data.maturity_date_str,
+            "settlement_date": input_data.settlement_date_str,
+        })
         if input_data.final_coupon_rate is not None:
-            table_lines.append(f"│ Final Coupon Rate           │ {input_data.final_coupon_rate:.2f}%                       │")
+            table += _FINAL_TERMS_COUPON_ROW.format(input_data.final_coupon_rate)
         if input_data.final_barrier_level is not None:
-            table_lines.append(f"│ Final Barrier Level         │ {input_data.final_barrier_level:.2f}%                      │")
-        table_lines.append("└─────────────────────────────┴─────────────────────────────────┘")
-        return "\n".join(table_lines)
+            table += _FINAL_TERMS_BARRIER_ROW.format(input_data.final_barrier_level)
+        return table + _FINAL_TERMS_TABLE_FOOTER
     
     def _extract_pricing_methodology(self, doc_dict: Dict[str, str], input_data: PRSInput) -> str:
         """Synthesize pricing methodology from market conditions if available"""
@@ -168,8 +254,8 @@ class LargeTextPRSAgent(LargeTextAgentMixin[PRSInput, PRSOutput]):
     def _extract_settlement_instructions(self, doc_dict: Dict[str, str], input_data: PRSInput) -> str:
         """Basic settlement instructions synthesized from dates"""
         return (
-            f"Settlement on {input_data.settlement_date.strftime('%B %d, %Y')} through CDS. "
-            f"Minimum denomination {int(input_data.minimum_denomination):,} {input_data.currency}."
+            f"Settlement on {input_data.settlement_date_str} through CDS. "
+            f"Minimum denomination {input_data.minimum_denomination_int_str} {input_data.currency}."
         )
     
     def _extract_delivery_procedures(self, doc_dict: Dict[str, str], input_data: PRSInput) -> str:
@@ -180,7 +266,7 @@ class LargeTextPRSAgent(LargeTextAgentMixin[PRSInput, PRSOutput]):
         """Summarize distribution method and denomination"""
         return (
             f"Distribution Method: {input_data.distribution_method}. "
-            f"Minimum Denomination: {int(input_data.minimum_denomination):,} {input_data.currency}."
+            f"Minimum Denomination: {input_data.minimum_denomination_int_str} {input_data.currency}."
         )
     
     def _extract_market_data_at_pricing(self, doc_dict: Dict[str, str], input_data: PRSInput) -> str:
@@ -204,43 +290,31 @@ class LargeTextPRSAgent(LargeTextAgentMixin[PRSInput, PRSOutput]):
         """Extract regulatory notices from regulatory_and_offering_disclaimers"""
         content = self._extract_text_field(doc_dict, "regulatory_and_offering_disclaimers", "")
         if not content:
-            return "Regulatory notices are available in the full document."
-        lines = content.split('\n')
-        regulatory_section = []
-        for line in lines:
-            if "No securities regulatory authority" in line or "regulatory" in line.lower():
-                regulatory_section.append(line.strip())
-        return ' '.join(regulatory_section) if regulatory_section else content.strip().split('\n')[0]
+            return _EMPTY_DOCUMENT_FIELDS["regulatory_notices"]
+        regulatory_lines = _REGULATORY_LINE_RE.findall(content)
+        if regulatory_lines:
+            return ' '.join(line.strip() for line in regulatory_lines)
+        return content.strip().partition('\n')[0]
     
     def _create_contact_information(self) -> str:
         """Create contact information"""
-        return "• Phone: 1-866-416-7891\n• Email: structured.products@scotiabank.com\n• Website: www.scotiabank.com/structuredproducts"
+        return _CONTACT_INFORMATION
     
-    def _extract_additional_sections(self, doc_dict: Dict[str, str]) -> Dict[str, str]:
+    def _extract_additional_sections(self, doc_dict: Dict[str, str]) -> Optional[Dict[str, str]]:
         """Extract a subset of canonical legal sections for reference"""
-        additional_sections: Dict[str, str] = {}
-        for key in [
-            "regulatory_and_offering_disclaimers",
-            "documents_incorporated_by_reference",
-            "forward_looking_statements",
-            "suitability_for_investment",
-            "deferred_payment",
-        ]:
-            val = self._extract_text_field(doc_dict, key, "")
-            if val and val != "Template not found.":
-                additional_sections[key] = val
-        return additional_sections if additional_sections else None
+        additional_sections = {
+            key: val
+            for key in _ADDITIONAL_SECTION_KEYS
+            for val in (self._extract_text_field(doc_dict, key, ""),)
+            if val and val != "Template not found."
+        }
+        return additional_sections or None
     
     def _format_additional_terms(self, additional_terms: Optional[Dict[str, Any]]) -> str:
         """Format additional terms for template"""
         if not additional_terms:
             return "None"
-        
-        terms = []
-        for key, value in additional_terms.items():
-            terms.append(f"{key}: {value}")
-        
-        return "; ".join(terms) 
+        return _additional_terms_template(tuple(additional_terms)).format(*additional_terms.values())
 
     async def generate_docx_with_large_templates(
         self,
@@ -279,10 +353,13 @@ class LargeTextPRSAgent(LargeTextAgentMixin[PRSInput, PRSOutput]):
             title=title or self._create_document_title(input_data),
             enforce_placeholder_validation=enforce_placeholder_validation,
         )
-        # Save JSON/TXT alongside DOCX using filename stem
+        # Save JSON/TXT alongside DOCX using filename stem, off the event loop
+        stem = os.path.splitext(os.path.basename(docx_path))[0]
+        loop = asyncio.get_running_loop()
         try:
-            stem = os.path.splitext(os.path.basename(docx_path))[0]
-            generator.save_sections(sections, filename_stem=stem, title=title)
-        except Exception:
-            pass
+            await loop.run_in_executor(
+                None, functools.partial(generator.save_sections, sections, filename_stem=stem, title=title)
+            )
+        except Exception as e:
+            logger.warning("Failed to save PRS JSON/TXT outputs for %s: %s", docx_path, e)
         return docx_path
\ No newline at end of file
@@ -194,25 +194,52 @@ Investors should consult their own tax advisors for advice with respect to the i
 # ⭐ TEMPLATE MANAGEMENT FUNCTIONS ⭐
 # =============================================================================
 
-from typing import Dict, List
-
-
-def list_canonical_section_keys() -> List[str]:
+import functools
+import re
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, TextIO, Tuple
+
+# Any bracketed token, e.g. "[Note Name]"; tokens without a matching variable are left as-is.
+# The pattern does not depend on the variable names, so one compiled regex serves every
+# call and batch; matching a token is a single dict lookup.
+_PLACEHOLDER_RE = re.compile(r"\[([^\[\]]+)\]")
+_MISSING = object()
+
+# Joins sections for a single substitution pass; never occurs in template text
+_SECTION_SEPARATOR = "\x00"
+
+# Canonical section key -> template text, built once from the sections above (read-only)
+_TEMPLATES: Mapping[str, str] = MappingProxyType({
+    "regulatory_and_offering_disclaimers": REGULATORY_AND_OFFERING_DISCLAIMERS,
+    "offering_overview": Offering_Overview,
+    "general_risks_and_guarantees": General_Risks_and_Guarantees,
+    "prospectus_and_capitalized_terms": Prospectus_and_Capitalized_Terms,
+    "documents_incorporated_by_reference": Documents_Incorporated_by_Reference,
+    "deferred_payment": Deferred_Payment,
+    "forward_looking_statements": Forward_looking_Statements,
+    "suitability_for_investment": Suitability_for_Investment,
+    "appendix_c_certain_canadian_federal_income_tax_considerations": Appendix_C_Certain_Canadian_Federal_Income_Tax_Considerations,
+})
+
+# Canonical section keys, in document order
+_CANONICAL_KEYS = tuple(_TEMPLATES)
+
+# Pure boilerplate sections (no brackets at all), which never need substitution.
+# Generated documents reference these module strings directly, so any number of
+# documents share a single copy of each.
+_PLACEHOLDER_FREE_SECTIONS = frozenset(key for key, template in _TEMPLATES.items() if "[" not in template)
+
+# The remaining sections, and their text pre-joined for the single substitution pass
+_SECTIONS_TO_CUSTOMIZE = tuple(key for key in _CANONICAL_KEYS if key not in _PLACEHOLDER_FREE_SECTIONS)
+_JOINED_SECTIONS_TO_CUSTOMIZE = _SECTION_SEPARATOR.join(_TEMPLATES[key] for key in _SECTIONS_TO_CUSTOMIZE)
+
+
+def list_canonical_section_keys() -> Tuple[str, ...]:
     """
     Return the canonical section keys exposed by this module.
     These keys are the stable identifiers that other components should use.
     """
-    return [
-        "regulatory_and_offering_disclaimers",
-        "offering_overview",
-        "general_risks_and_guarantees",
-        "prospectus_and_capitalized_terms",
-        "documents_incorporated_by_reference",
-        "deferred_payment",
-        "forward_looking_statements",
-        "suitability_for_investment",
-        "appendix_c_certain_canadian_federal_income_tax_considerations",
-    ]
+    return _CANONICAL_KEYS
 
 
 def get_template(template_name: str, audience: str = "retail") -> str:
@@ -222,19 +249,7 @@ def get_template(template_name: str, audience: str = "retail") -> str:
     Supported canonical names are provided by list_canonical_section_keys().
     The audience parameter is accepted for API compatibility.
     """
-    canonical_templates: Dict[str, str] = {
-        "regulatory_and_offering_disclaimers": REGULATORY_AND_OFFERING_DISCLAIMERS,
-        "offering_overview": Offering_Overview,
-        "general_risks_and_guarantees": General_Risks_and_Guarantees,
-        "prospectus_and_capitalized_terms": Prospectus_and_Capitalized_Terms,
-        "documents_incorporated_by_reference": Documents_Incorporated_by_Reference,
-        "deferred_payment": Deferred_Payment,
-        "forward_looking_statements": Forward_looking_Statements,
-        "suitability_for_investment": Suitability_for_Investment,
-        "appendix_c_certain_canadian_federal_income_tax_considerations": Appendix_C_Certain_Canadian_Federal_Income_Tax_Considerations,
-    }
-
-    return canonical_templates.get(template_name, "Template not found.")
+    return _TEMPLATES.get(template_name, "Template not found.")
 
 
 def customize_template(template: str, variables: dict) -> str:
@@ -248,12 +263,18 @@ def customize_template(template: str, variables: dict) -> str:
     Returns:
         Customized template
     """
-    customized = template
-    for placeholder, value in variables.items():
-        placeholder_key = f"[{placeholder}]"
-        if placeholder_key in customized:
-            customized = customized.replace(placeholder_key, str(value))
-    return customized
+    if not variables or "[" not in template:
+        return template
+
+    def _substitute(match: "re.Match[str]") -> str:
+        value = variables.get(match.group(1), _MISSING)
+        if value is _MISSING:
+            return match.group(0)
+        return value if type(value) is str else str(value)
+
+    # One scan over the template, however many variables are supplied; re.sub gathers the
+    # literal slices and replacements and joins them once, so the text is copied a single time
+    return _PLACEHOLDER_RE.sub(_substitute, template)
 
 
 def create_complete_document_from_templates(product_data: dict, audience: str = "retail") -> dict:
@@ -268,15 +289,64 @@ def create_complete_document_from_templates(product_data: dict, audience: str =
     Returns:
         Dict[str, str]: Canonical section key -> customized content
     """
-    # Pull canonical templates
-    sections = {key: get_template(key, audience) for key in list_canonical_section_keys()}
+    # Key on the text that is actually substituted: values that compare equal can still
+    # render differently (Decimal("5.0") vs Decimal("5.00"), 0.0 vs -0.0)
+    cache_key = frozenset(
+        (key, value if type(value) is str else str(value)) for key, value in product_data.items()
+    )
+    return dict(_render_document_cached(cache_key, audience))
+
+
+@functools.lru_cache(maxsize=64)
+def _render_document_cached(cache_key: FrozenSet[Tuple[Any, str]], audience: str) -> Dict[str, str]:
+    """Render a document for a snapshot of product_data as substituted strings (callers get a copy)"""
+    return _render_document(dict(cache_key), audience)
+
+
+def _render_document(product_data: dict, audience: str) -> Dict[str, str]:
+    """Substitute product_data into every canonical section"""
+    # Start from the canonical templates; sections without placeholders are used as-is
+    document = dict(_TEMPLATES)
 
-    # Perform variable substitution without altering the original templates
-    document = {key: customize_template(template, product_data) for key, template in sections.items()}
+    # Substitute across the remaining sections in one pass, then split them apart again.
+    # The lookup callback runs Python code under the GIL, so threads would not speed this up.
+    rendered = customize_template(_JOINED_SECTIONS_TO_CUSTOMIZE, product_data).split(_SECTION_SEPARATOR)
+    if len(rendered) != len(_SECTIONS_TO_CUSTOMIZE):
+        # A substituted value contained the separator; fall back to one pass per section
+        rendered = [customize_template(document[key], product_data) for key in _SECTIONS_TO_CUSTOMIZE]
 
+    document.update(zip(_SECTIONS_TO_CUSTOMIZE, rendered))
     return document
 
 
+def render_to_stream(product_data: dict, out: TextIO, audience: str = "retail") -> None:
+    """
+    Write the complete customized document to a text stream, section by section.
+
+    Produces the same text as joining create_complete_document_from_templates()
+    values, without holding the rendered sections in memory.
+
+    Args:
+        product_data: Variables to substitute into templates
+        out: Writable text stream (file, StringIO, ...)
+        audience: Accepted for API compatibility.
+    """
+    for key in _CANONICAL_KEYS:
+        template = _TEMPLATES[key]
+        if not product_data or key in _PLACEHOLDER_FREE_SECTIONS:
+            out.write(template)
+            continue
+        last = 0
+        for match in _PLACEHOLDER_RE.finditer(template):
+            value = product_data.get(match.group(1), _MISSING)
+            if value is _MISSING:
+                continue
+            out.write(template[last:match.start()])
+            out.write(value if type(value) is str else str(value))
+            last = match.end()
+        out.write(template[last:])
+
+
 # =============================================================================
 # ⭐ TESTING YOUR CUSTOMIZATIONS ⭐
 # =============================================================================
@@ -311,15 +381,17 @@ def test_your_templates():
         "Final Valuation Date": "January 28, 2032",
     }
     
-    print("🧪 Testing PRS Large Text Templates")
-    print("=" * 50)
-    
     # Test template generation
     document = create_complete_document_from_templates(your_sample_data, "retail")
     
-    print("✅ Templates generated successfully!")
-    for key in list_canonical_section_keys():
-        print(f"📄 {key}: {len(document[key])} characters")
+    # Emit the whole report with a single write
+    report = [
+        "🧪 Testing PRS Large Text Templates",
+        "=" * 50,
+        "✅ Templates generated successfully!",
+    ]
+    report.extend(f"📄 {key}: {len(document[key])} characters" for key in list_canonical_section_keys())
+    print("\n".join(report))
     
     return document
 
@@ -4,12 +4,34 @@ Pydantic models for the PRS (Pricing Supplement) agent.
 TODO: Full implementation pending ISM agent completion.
 """
 
+from functools import lru_cache
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
-from datetime import date, datetime
+from typing import Optional, Dict, Any
+from datetime import date
 from core.base_agent import BaseFinancialAgentDeps
 
 
+# Display format for dates in prompts and generated documents (e.g. "January 15, 2025")
+DISPLAY_DATE_FORMAT = "%B %d, %Y"
+
+
+@lru_cache(maxsize=2048)
+def format_display_date(value: date) -> str:
+    """
+    Format a date for display, reusing the string across inputs sharing that date.
+
+    When many PRS documents are rendered in one process, each distinct date is
+    formatted only once for the whole batch, so no separate batch API is needed.
+    """
+    return value.strftime(DISPLAY_DATE_FORMAT)
+
+
+@lru_cache(maxsize=2048, typed=True)
+def format_amount(value: float, spec: str = ",.2f") -> str:
+    """Format an amount for display, reusing the string across inputs sharing that value."""
+    return format(value, spec)
+
+
 class PRSInput(BaseModel):
     """
     Input model for PRS (Pricing Supplement) document generation.
@@ -52,6 +74,56 @@ class PRSInput(BaseModel):
     # Additional Final Terms
     additional_terms: Optional[Dict[str, Any]] = Field(default=None, description="Additional final terms")
 
+    class Config:
+        frozen = True
+
+    # Display strings used by the prompt and document builders. They are derived from the
+    # current fields on every access (the formatters are memoized), so copies made with
+    # model_copy(update=...) never carry stale strings, and they are not part of model_dump().
+    @property
+    def pricing_date_str(self) -> str:
+        return format_display_date(self.pricing_date)
+
+    @property
+    def issue_date_str(self) -> str:
+        return format_display_date(self.issue_date)
+
+    @property
+    def maturity_date_str(self) -> str:
+        return format_display_date(self.maturity_date)
+
+    @property
+    def settlement_date_str(self) -> str:
+        return format_display_date(self.settlement_date)
+
+    @property
+    def pricing_date_iso(self) -> str:
+        return self.pricing_date.strftime('%Y-%m-%d')
+
+    @property
+    def pricing_date_compact(self) -> str:
+        return self.pricing_date.strftime('%Y%m%d')
+
+    @property
+    def final_issue_price_str(self) -> str:
+        return format_amount(self.final_issue_price, ".2f")
+
+    @property
+    def final_principal_amount_str(self) -> str:
+        return format_amount(self.final_principal_amount)
+
+    @property
+    def final_principal_amount_rounded_str(self) -> str:
+        return format_amount(self.final_principal_amount, ",.0f")
+
+    @property
+    def minimum_denomination_str(self) -> str:
+        return format_amount(self.minimum_denomination)
+
+    @property
+    def minimum_denomination_int_str(self) -> str:
+        return format_amount(int(self.minimum_denomination), ",")
+
 
 class PRSOutput(BaseModel):
     """
@@ -100,6 +172,9 @@ class PRSOutput(BaseModel):
     document_version: str = Field(default="1.0", description="Document version")
     generation_date: str = Field(..., description="Date when document was generated")
     pricing_timestamp: str = Field(..., description="Timestamp of pricing")
+    
+    class Config:
+        frozen = True
 
 
 class PRSAgentDeps(BaseFinancialAgentDeps):
@@ -2,18 +2,74 @@
 PDS (Prospectus Supplement) Agent implementation using Pydantic AI framework.
 """
 
-from typing import Optional
+import asyncio
+from typing import Dict, Optional, Tuple
 from datetime import datetime
 from pydantic_ai import Agent, RunContext
-from lightrag import LightRAG, QueryParam
+from lightrag import LightRAG
 
 from core.base_agent import BaseFinancialAgent
 from core.knowledge_updater import KnowledgeUpdater
+from core.query_cache import query_cache
 from .models import PDSInput, PDSOutput, PDSAgentDeps
 from .instructions import PDSInstructions
 from .config import PDSConfig
 
 
+# Knowledge base retrievals used by the PDS tools: key -> (heading, query template, top_k, error subject)
+_PDS_RETRIEVALS: Dict[str, Tuple[str, str, int, str]] = {
+    "base_prospectus": (
+        "**Base Prospectus Content:**",
+        "base prospectus {reference} {section_keywords} key sections",
+        8, "base prospectus"
+    ),
+    "note_specific_terms": (
+        "**Note-Specific Terms:**",
+        "{product_type} prospectus supplement {underlying_asset} {focus} terms examples",
+        10, "note-specific terms"
+    ),
+    "regulatory_requirements": (
+        "**Regulatory Requirements:**",
+        "regulatory disclosure {jurisdiction} {document_type} requirements mandatory language",
+        6, "regulatory requirements"
+    ),
+    "risk_factors": (
+        "**Risk Factors:**",
+        "risk factors {product_type} supplement {underlying_asset} examples language",
+        8, "risk factors"
+    ),
+    "supplement_purpose_templates": (
+        "**Supplement Purpose Templates:**",
+        "{jurisdiction} prospectus supplement purpose language relationship to base prospectus template",
+        6, "supplement purpose templates"
+    ),
+    "calculation_agent_determinations": (
+        "**Calculation Agent Determinations:**",
+        "{product_type} {focus} prospectus supplement language adjustments methodology",
+        6, "calculation agent determinations"
+    ),
+    "risk_introductions": (
+        "**Risk Introductions:**",
+        "{jurisdiction} {product_type} prospectus supplement risk introduction paragraph examples",
+        5, "risk introductions"
+    ),
+}
+
+# Retrievals the user prompt requires, gathered together by retrieve_pds_context
+_PDS_REQUIRED_RETRIEVALS = ("base_prospectus", "note_specific_terms", "regulatory_requirements", "risk_factors")
+
+
+async def _retrieve(lightrag: LightRAG, key: str, **fields: str) -> str:
+    """Run one PDS knowledge base retrieval and format it under its heading"""
+    heading, query_template, top_k, subject = _PDS_RETRIEVALS[key]
+    try:
+        query = query_template.format(**fields)
+        result = await query_cache.aquery(lightrag, query, mode="mix", top_k=top_k)
+        return f"{heading}\n{result}"
+    except Exception as e:
+        return f"Error retrieving {subject}: {str(e)}"
+
+
 class PDSAgent(BaseFinancialAgent[PDSInput, PDSOutput, PDSAgentDeps]):
     """
     PDS (Prospectus Supplement) Agent specialized in generating prospectus supplement 
@@ -37,11 +93,15 @@ class PDSAgent(BaseFinancialAgent[PDSInput, PDSOutput, PDSAgentDeps]):
         self.pds_config = config or PDSConfig.get_default_config()
         self.instructions = PDSInstructions()
         
+        # Built once per agent; every run reuses the same config dump and instructions
+        self._config_dump = self.pds_config.model_dump()
+        self._system_instructions = self.instructions.get_base_instructions()
+        
         super().__init__(
             agent_type="pds",
             knowledge_base_path=knowledge_base_path,
             model_name=model_name,
-            agent_config=self.pds_config.model_dump()
+            agent_config=self._config_dump
         )
     
     def _create_agent(self) -> Agent[PDSAgentDeps, PDSOutput]:
@@ -50,13 +110,42 @@ class PDSAgent(BaseFinancialAgent[PDSInput, PDSOutput, PDSAgentDeps]):
             model=self.model_name,
             deps_type=PDSAgentDeps,
             output_type=PDSOutput,
-            instructions=self.get_system_instructions()
+            instructions=self._system_instructions
         )
         return agent
     
     def _register_agent_tools(self):
         """Register PDS-specific tools for document generation"""
         
+        @self.agent.tool
+        async def retrieve_pds_context(
+            ctx: RunContext[PDSAgentDeps],
+            reference: str,
+            product_type: str,
+            underlying_asset: str,
+            jurisdiction: str = "Canada",
+            section_keywords: str = "summary risk factors offering particulars",
+            focus: str = "calculation methodology and payment schedule",
+            document_type: str = "prospectus_supplement"
+        ) -> str:
+            """
+            Retrieve the required PDS knowledge base context in one call: base prospectus sections,
+            note-specific terms, regulatory requirements, and risk factors. Queries run concurrently.
+            """
+            fields = {
+                "reference": reference,
+                "section_keywords": section_keywords,
+                "product_type": product_type,
+                "underlying_asset": underlying_asset,
+                "focus": focus,
+                "jurisdiction": jurisdiction,
+                "document_type": document_type,
+            }
+            results = await asyncio.gather(
+                *(_retrieve(ctx.deps.lightrag, key, **fields) for key in _PDS_REQUIRED_RETRIEVALS)
+            )
+            return "\n\n".join(results)
+        
         @self.agent.tool
         async def retrieve_base_prospectus(
             ctx: RunContext[PDSAgentDeps], 
@@ -73,12 +162,7 @@ class PDSAgent(BaseFinancialAgent[PDSInput, PDSOutput, PDSAgentDeps]):
             Returns:
                 Extracted base prospectus content
             """
-            try:
-                query = f"base prospectus {reference} {section_keywords} key sections"
-                result = await ctx.deps.lightrag.aquery(query, param=QueryParam(mode="mix", top_k=8))
-                return f"**Base Prospectus Content:**\n{result}"
-            except Exception as e:
-                return f"Error retrieving base prospectus: {str(e)}"
+            return await _retrieve(ctx.deps.lightrag, "base_prospectus", reference=reference, section_keywords=section_keywords)
 
         @self.agent.tool
         async def retrieve_note_specific_terms(
@@ -90,12 +174,10 @@ class PDSAgent(BaseFinancialAgent[PDSInput, PDSOutput, PDSAgentDeps]):
             """
             Retrieve note-specific terms, structures, and examples from the PDS knowledge base.
             """
-            try:
-                query = f"{product_type} prospectus supplement {underlying_asset} {focus} terms examples"
-                result = await ctx.deps.lightrag.aquery(query, param=QueryParam(mode="mix", top_k=10))
-                return f"**Note-Specific Terms:**\n{result}"
-            except Exception as e:
-                return f"Error retrieving note-specific terms: {str(e)}"
+            return await _retrieve(
+                ctx.deps.lightrag, "note_specific_terms",
+                product_type=product_type, underlying_asset=underlying_asset, focus=focus
+            )
 
         @self.agent.tool
         async def retrieve_regulatory_requirements(
@@ -106,12 +188,7 @@ class PDSAgent(BaseFinancialAgent[PDSInput, PDSOutput, PDSAgentDeps]):
             """
             Retrieve regulatory requirements and mandatory disclosures for the jurisdiction.
             """
-            try:
-                query = f"regulatory disclosure {jurisdiction} {document_type} requirements mandatory language"
-                result = await ctx.deps.lightrag.aquery(query, param=QueryParam(mode="mix", top_k=6))
-                return f"**Regulatory Requirements:**\n{result}"
-            except Exception as e:
-                return f"Error retrieving regulatory requirements: {str(e)}"
+            return await _retrieve(ctx.deps.lightrag, "regulatory_requirements", jurisdiction=jurisdiction, document_type=document_type)
 
         @self.agent.tool
         async def retrieve_risk_factors(
@@ -122,12 +199,7 @@ class PDSAgent(BaseFinancialAgent[PDSInput, PDSOutput, PDSAgentDeps]):
             """
             Retrieve risk factors specific to this prospectus supplement.
             """
-            try:
-                query = f"risk factors {product_type} supplement {underlying_asset} examples language"
-                result = await ctx.deps.lightrag.aquery(query, param=QueryParam(mode="mix", top_k=8))
-                return f"**Risk Factors:**\n{result}"
-            except Exception as e:
-                return f"Error retrieving risk factors: {str(e)}"
+            return await _retrieve(ctx.deps.lightrag, "risk_factors", product_type=product_type, underlying_asset=underlying_asset)
 
         @self.agent.tool
         async def retrieve_supplement_purpose_templates(
@@ -137,12 +209,7 @@ class PDSAgent(BaseFinancialAgent[PDSInput, PDSOutput, PDSAgentDeps]):
             """
             Retrieve concise purpose/relationship-to-base-prospectus templates for supplements.
             """
-            try:
-                query = f"{jurisdiction} prospectus supplement purpose language relationship to base prospectus template"
-                result = await ctx.deps.lightrag.aquery(query, param=QueryParam(mode="mix", top_k=6))
-                return f"**Supplement Purpose Templates:**\n{result}"
-            except Exception as e:
-                return f"Error retrieving supplement purpose templates: {str(e)}"
+            return await _retrieve(ctx.deps.lightrag, "supplement_purpose_templates", jurisdiction=jurisdiction)
 
         @self.agent.tool
         async def retrieve_calculation_agent_determinations(
@@ -153,12 +220,7 @@ class PDSAgent(BaseFinancialAgent[PDSInput, PDSOutput, PDSAgentDeps]):
             """
             Retrieve standard language around calculation agent determinations/adjustments.
             """
-            try:
-                query = f"{product_type} {focus} prospectus supplement language adjustments methodology"
-                result = await ctx.deps.lightrag.aquery(query, param=QueryParam(mode="mix", top_k=6))
-                return f"**Calculation Agent Determinations:**\n{result}"
-            except Exception as e:
-                return f"Error retrieving calculation agent determinations: {str(e)}"
+            return await _retrieve(ctx.deps.lightrag, "calculation_agent_determinations", product_type=product_type, focus=focus)
 
         @self.agent.tool
         async def retrieve_risk_introductions(
@@ -169,16 +231,11 @@ class PDSAgent(BaseFinancialAgent[PDSInput, PDSOutput, PDSAgentDeps]):
             """
             Retrieve succinct risk introduction paragraphs appropriate for supplements.
             """
-            try:
-                query = f"{jurisdiction} {product_type} prospectus supplement risk introduction paragraph examples"
-                result = await ctx.deps.lightrag.aquery(query, param=QueryParam(mode="mix", top_k=5))
-                return f"**Risk Introductions:**\n{result}"
-            except Exception as e:
-                return f"Error retrieving risk introductions: {str(e)}"
+            return await _retrieve(ctx.deps.lightrag, "risk_introductions", product_type=product_type, jurisdiction=jurisdiction)
     
     def get_system_instructions(self) -> str:
         """Get PDS-specific system instructions"""
-        return self.instructions.get_base_instructions()
+        return self._system_instructions
     
     async def _create_dependencies(self, lightrag: LightRAG, input_data: PDSInput) -> PDSAgentDeps:
         """Create PDS-specific dependencies"""
@@ -186,7 +243,7 @@ class PDSAgent(BaseFinancialAgent[PDSInput, PDSOutput, PDSAgentDeps]):
             lightrag=lightrag,
             agent_type=self.agent_type,
             input_data=input_data,
-            config=self.pds_config.model_dump()
+            config=self._config_dump
         )
     
     def _format_user_prompt(self, input_data: PDSInput) -> str:
@@ -221,6 +278,8 @@ class PDSAgent(BaseFinancialAgent[PDSInput, PDSOutput, PDSAgentDeps]):
         - {input_data.additional_terms or {}}
 
         ## REQUIRED TOOL USAGE
+        Prefer retrieve_pds_context(...), which runs the four retrievals below concurrently in a
+        single call; use the individual tools only to refine a specific section.
         1. retrieve_base_prospectus(reference, section_keywords="summary risk factors offering particulars")
         2. retrieve_note_specific_terms(product_type, underlying_asset, focus="calculation methodology and payment schedule")
         3. retrieve_regulatory_requirements(jurisdiction="Canada", document_type="prospectus_supplement")
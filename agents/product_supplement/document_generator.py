@@ -5,6 +5,7 @@ TODO: Full implementation pending ISM agent completion.
 """
 
 import os
+import re
 from datetime import datetime
 from typing import Optional, Dict, Any
 try:
@@ -17,6 +18,15 @@ from .config import PDSConfig
 from core.config import global_config
 
 
+# Characters outside word characters, spaces and hyphens are dropped from filenames
+_SAFE_SERIES_RE = re.compile(r"[^\w \-]+")
+
+
+def _safe_stem(series: str) -> str:
+    """Strip a note series down to characters that are safe in a filename"""
+    return _SAFE_SERIES_RE.sub("", series).rstrip()
+
+
 class PDSDocumentGenerator:
     """
     Generator for creating formatted PDS documents from structured output.
@@ -52,8 +62,7 @@ class PDSDocumentGenerator:
         import json
 
         if not filename_stem:
-            safe_series = "".join(c for c in input_data.note_series if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            filename_stem = f"PDS_{safe_series}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            filename_stem = f"PDS_{_safe_stem(input_data.note_series)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
         json_path = os.path.join(self.output_dir, f"{filename_stem}.json")
         txt_path = os.path.join(self.output_dir, f"{filename_stem}.txt")
@@ -167,8 +176,7 @@ class PDSDocumentGenerator:
         
         # Generate filename if not provided
         if not filename:
-            safe_series = "".join(c for c in input_data.note_series if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            filename = f"PDS_{safe_series}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.docx"
+            filename = f"PDS_{_safe_stem(input_data.note_series)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.docx"
         
         # Save document
         file_path = os.path.join(self.output_dir, filename)
@@ -177,9 +177,8 @@ def customize_template(template: str, variables: dict) -> str:
     customized = template
     
     for placeholder, value in variables.items():
-        placeholder_key = f"[{placeholder}]"
-        if placeholder_key in customized:
-            customized = customized.replace(placeholder_key, str(value))
+        # replace() already returns the string unchanged when the placeholder is absent
+        customized = customized.replace(f"[{placeholder}]", str(value))
     
     return customized
 
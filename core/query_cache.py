@@ -0,0 +1,130 @@
+"""
+In-process cache for LightRAG query results.
+
+Agent tools build their knowledge base queries deterministically from a small
+set of inputs, so the same query is often issued several times while a document
+is generated or revised. This cache keeps recent results for a limited time and
+is cleared whenever a knowledge base is updated.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from lightrag import LightRAG, QueryParam
+from lightrag.prompt import PROMPTS
+
+logger = logging.getLogger(__name__)
+
+# Answer LightRAG returns, rather than raises, when it finds no context for a query
+_FAIL_RESPONSE = PROMPTS["fail_response"]
+
+
+class QueryCache:
+    """
+    LRU cache with a time-to-live for LightRAG `aquery` results.
+
+    Entries are keyed by (knowledge base, mode, top_k, normalized query). Only
+    successful results are cached: errors propagate to the caller, and empty results
+    or LightRAG's no-context answer are returned without being stored. Concurrent
+    identical queries on one event loop share a single LightRAG call.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600.0):
+        """
+        Initialize the query cache.
+
+        Args:
+            maxsize: Maximum number of cached results
+            ttl: Seconds a cached result stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]]" = OrderedDict()
+        # Queries currently running, so concurrent identical queries wait for the same call
+        self._in_flight: Dict[Tuple[Hashable, ...], "asyncio.Task[Any]"] = {}
+        # Bumped by invalidate so results of queries started before it are not stored
+        self._generation = 0
+
+    async def aquery(self, lightrag: LightRAG, query: str, mode: str = "mix", top_k: int = 5) -> Any:
+        """
+        Query a LightRAG instance, reusing a cached result for identical queries.
+
+        Args:
+            lightrag: LightRAG instance to query
+            query: Query text
+            mode: LightRAG query mode
+            top_k: Number of results to retrieve
+
+        Returns:
+            The LightRAG query result
+        """
+        key = (self._knowledge_base_key(lightrag), mode, top_k, self._normalize(query))
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                return result
+            del self._entries[key]
+
+        loop = asyncio.get_running_loop()
+        pending = self._in_flight.get(key)
+        if pending is None or pending.get_loop() is not loop:
+            pending = loop.create_task(self._fetch(key, lightrag, query, mode, top_k))
+            self._in_flight[key] = pending
+        # Shielded so a cancelled caller does not cancel the call other callers wait on
+        return await asyncio.shield(pending)
+
+    async def _fetch(self, key: Tuple[Hashable, ...], lightrag: LightRAG, query: str, mode: str, top_k: int) -> Any:
+        """Run one LightRAG query and cache its result if it is worth reusing"""
+        generation = self._generation
+        try:
+            result = await lightrag.aquery(query, param=QueryParam(mode=mode, top_k=top_k))
+        finally:
+            if self._in_flight.get(key) is asyncio.current_task():
+                del self._in_flight[key]
+
+        if generation == self._generation and self._is_cacheable(result):
+            self._entries[key] = (time.monotonic() + self.ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return result
+
+    def invalidate(self):
+        """Drop all cached results (call after a knowledge base changes)"""
+        if self._entries:
+            logger.debug(f"Invalidating {len(self._entries)} cached LightRAG query results")
+        self._entries.clear()
+        self._in_flight.clear()
+        self._generation += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _is_cacheable(result: Any) -> bool:
+        """Whether a result is a real answer rather than an empty or no-context response"""
+        if not result:
+            return False
+        return not (isinstance(result, str) and result.strip() == _FAIL_RESPONSE)
+
+    @staticmethod
+    def _normalize(query: str) -> str:
+        """Collapse whitespace so formatting differences map to the same entry"""
+        return " ".join(query.split())
+
+    @staticmethod
+    def _knowledge_base_key(lightrag: LightRAG) -> Hashable:
+        """Identify the knowledge base behind a LightRAG instance"""
+        working_dir: Optional[str] = getattr(lightrag, "working_dir", None)
+        return working_dir if working_dir is not None else id(lightrag)
+
+
+# Global query cache instance
+query_cache = QueryCache()
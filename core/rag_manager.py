@@ -12,6 +12,7 @@ from lightrag.llm.openai import gpt_4o_mini_complete, openai_embed
 from lightrag import LightRAG, QueryParam
 
 from .config import global_config
+from .query_cache import query_cache
 
 # Configure logging to use the level from global_config
 logging.basicConfig(level=global_config.log_level, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -140,6 +141,7 @@ class RAGManager:
                 return {"success": True, "message": "Empty document skipped."}
 
             await rag_instance.ainsert_custom_chunks(full_text=full_text, text_chunks=text_chunks)
+            query_cache.invalidate()
             
             logger.info(f"Successfully inserted document into domain '{domain}'.")
             return {"success": True, "message": f"Document inserted successfully into domain '{domain}'."}
@@ -10,7 +10,8 @@ from datetime import date
 
 from agents.product_supplement import PDSInput
 from agents.product_supplement import LargeTextPDSAgent
-from agents.product_supplement.document_generator import PDSDocumentGenerator
+from agents.product_supplement.agent import PDSAgent
+from agents.product_supplement.document_generator import PDSDocumentGenerator, _safe_stem
 from agents.product_supplement.large_text_templates import list_canonical_section_keys, get_template, customize_template
 
 
@@ -83,6 +84,26 @@ def test_large_text_pds_generation():
     assert "json_path" in paths and "txt_path" in paths
 
 
+def test_pds_agent_reuses_config_and_instructions(monkeypatch):
+    # "test" selects Pydantic AI's offline TestModel
+    agent = PDSAgent(model_name="test")
+
+    def _no_redump(self, *args, **kwargs):
+        raise AssertionError("PDSConfig dumped again after construction")
+
+    monkeypatch.setattr(type(agent.pds_config), "model_dump", _no_redump)
+    deps = asyncio.run(agent._create_dependencies(lightrag=None, input_data=_sample_input()))
+
+    assert deps.config == agent.agent_config
+    assert agent.get_system_instructions() is agent.get_system_instructions()
+
+
+def test_safe_stem_matches_character_filter():
+    for series in ["Series 2025-1", "Série/2025 (A)  ", "Notes: 5%_x"]:
+        expected = "".join(c for c in series if c.isalnum() or c in (" ", "-", "_")).rstrip()
+        assert _safe_stem(series) == expected
+
+
 if __name__ == "__main__":
     # Allow running directly
     test_large_text_pds_generation()
@@ -0,0 +1,59 @@
+"""
+Tests for the PDS knowledge base retrieval helpers.
+
+The stub LightRAG fixtures from tests/conftest.py record the queries, so no knowledge
+base or LLM is needed.
+"""
+
+import asyncio
+
+from agents.product_supplement.agent import _PDS_REQUIRED_RETRIEVALS, _PDS_RETRIEVALS, _retrieve
+from core.query_cache import query_cache
+
+
+def test_retrieve_formats_query_and_heading(recording_lightrag):
+    query_cache.invalidate()
+
+    result = asyncio.run(_retrieve(recording_lightrag, "risk_factors", product_type="autocallable", underlying_asset="S&P 500 Index"))
+
+    assert recording_lightrag.queries == [("risk factors autocallable supplement S&P 500 Index examples language", 8)]
+    assert result.startswith("**Risk Factors:**\n")
+
+
+def test_retrieve_reports_errors_inline(failing_lightrag):
+    result = asyncio.run(_retrieve(failing_lightrag, "regulatory_requirements", jurisdiction="Canada", document_type="prospectus_supplement"))
+
+    assert result == "Error retrieving regulatory requirements: knowledge base offline"
+
+
+def test_retrieve_reuses_cached_results(recording_lightrag):
+    query_cache.invalidate()
+
+    first = asyncio.run(_retrieve(recording_lightrag, "risk_introductions", product_type="autocallable", jurisdiction="Canada"))
+    second = asyncio.run(_retrieve(recording_lightrag, "risk_introductions", product_type="autocallable", jurisdiction="Canada"))
+
+    assert first == second
+    assert len(recording_lightrag.queries) == 1
+
+
+def test_required_retrievals_gather_concurrently(recording_lightrag):
+    query_cache.invalidate()
+    fields = {
+        "reference": "Base Shelf Prospectus",
+        "section_keywords": "summary",
+        "product_type": "autocallable",
+        "underlying_asset": "S&P 500 Index",
+        "focus": "calculation methodology",
+        "jurisdiction": "Canada",
+        "document_type": "prospectus_supplement",
+    }
+
+    async def gather():
+        return await asyncio.gather(*(_retrieve(recording_lightrag, key, **fields) for key in _PDS_REQUIRED_RETRIEVALS))
+
+    results = asyncio.run(gather())
+
+    assert len(recording_lightrag.queries) == len(_PDS_REQUIRED_RETRIEVALS)
+    assert [r.split("\n", 1)[0] for r in results] == [_PDS_RETRIEVALS[key][0] for key in _PDS_REQUIRED_RETRIEVALS]
+    for _, query_template, _, _ in _PDS_RETRIEVALS.values():
+        assert "{" not in query_template.format(**fields)
@@ -6,7 +6,13 @@ maps templates into the PRSOutput model.
 """
 
 import asyncio
-from datetime import date
+import io
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
 
 from agents.pricing_supplement import LargeTextPRSAgent
 from agents.pricing_supplement.models import PRSInput
@@ -70,9 +76,285 @@ def test_large_text_prs_generation():
     assert result.pricing_timestamp and isinstance(result.pricing_timestamp, str)
 
 
+def test_input_display_strings_are_derived_and_not_dumped():
+    input_data = _sample_input()
+
+    assert input_data.pricing_date_str == "January 29, 2025"
+    assert input_data.pricing_date_iso == "2025-01-29"
+    assert input_data.final_principal_amount_str == "100,000,000.00"
+    assert input_data.pricing_date_str is input_data.pricing_date_str
+    assert "pricing_date_str" not in input_data.model_dump()
+
+
+def test_template_variables_reuse_input_display_strings():
+    input_data = _sample_input()
+    variables = LargeTextPRSAgent(base_agent=None)._extract_agent_specific_variables(input_data)
+
+    assert variables["Pricing Date"] is input_data.pricing_date_str
+    assert variables["Settlement Date"] == "February 04, 2025"
+    assert variables["Generation Date"] == datetime.strptime(variables["Document Date"], "%B %d, %Y").strftime("%Y-%m-%d")
+
+
+def test_display_dates_are_shared_across_inputs():
+    first, second = _sample_input(), _sample_input()
+
+    assert first.pricing_date_str is second.pricing_date_str
+    assert first.maturity_date_str == "January 31, 2032"
+
+
+def test_additional_terms_format_reuses_template_per_key_layout():
+    agent = LargeTextPRSAgent(base_agent=None)
+
+    assert agent._format_additional_terms({"Listing": "Not listed", "Rate {x}": 1.5}) == "Listing: Not listed; Rate {x}: 1.5"
+    assert agent._format_additional_terms({"Listing": "TSX", "Rate {x}": "{y}"}) == "Listing: TSX; Rate {x}: {y}"
+    assert agent._format_additional_terms({}) == "None"
+
+
+def test_create_docx_batch_saves_each_document(tmp_path):
+    from agents.pricing_supplement.document_generator import PRSDocumentGenerator
+
+    input_data = _sample_input()
+    output = asyncio.run(LargeTextPRSAgent(base_agent=None).generate_document_for_testing(input_data))
+    generator = PRSDocumentGenerator()
+    generator.output_dir = str(tmp_path)
+
+    paths = generator.create_docx_batch([
+        (output, input_data, "prs_batch_1.docx"),
+        (output, input_data, "prs_batch_2.docx"),
+    ])
+
+    assert paths == [str(tmp_path / "prs_batch_1.docx"), str(tmp_path / "prs_batch_2.docx")]
+    assert all((tmp_path / name).stat().st_size > 0 for name in ["prs_batch_1.docx", "prs_batch_2.docx"])
+
+
+def test_create_all_outputs_matches_separate_renderings(tmp_path):
+    from agents.pricing_supplement.document_generator import PRSDocumentGenerator
+    from agents.pricing_supplement.large_text_templates import create_complete_document_from_templates
+
+    sections = create_complete_document_from_templates({"Series Number": "2025-1"})
+    generator = PRSDocumentGenerator()
+    generator.output_dir = str(tmp_path)
+
+    separate = generator.save_sections(sections, filename_stem="separate", title="PRS")
+    fused = generator.create_all_outputs(
+        sections, filename_stem="fused", title="PRS", enforce_placeholder_validation=False
+    )
+
+    assert (tmp_path / "fused.docx").exists()
+    for key in ["json_path", "txt_path"]:
+        with open(fused[key], encoding="utf-8") as f_fused, open(separate[key], encoding="utf-8") as f_separate:
+            assert f_fused.read() == f_separate.read()
+
+
+def test_placeholder_validation_results_are_reused_but_not_shared():
+    from agents.pricing_supplement.document_generator import PRSDocumentGenerator
+
+    sections = {"offering_overview": "Series [Series Number] due [Maturity Date]", "deferred_payment": "Resolved"}
+
+    first = PRSDocumentGenerator.validate_no_unresolved_placeholders(sections)
+    first["offering_overview"].append("mutated")
+    second = PRSDocumentGenerator.validate_no_unresolved_placeholders(dict(sections))
+
+    assert second == {"offering_overview": ["Maturity Date", "Series Number"]}
+    assert PRSDocumentGenerator.validate_no_unresolved_placeholders({"offering_overview": "Series 2025-1"}) == {}
+
+
+def test_batched_docx_body_matches_python_docx_paragraphs():
+    from docx import Document
+    from lxml import etree
+    from agents.pricing_supplement.document_generator import _append_paragraphs, _heading
+
+    expected = Document()
+    expected.add_heading("Terms & <Conditions>", level=0)
+    expected.add_paragraph("Issue Price:\t100.00%\nSeries 2025-1 ")
+    expected.add_paragraph("")
+    expected.add_heading("Final Terms", level=1)
+
+    actual = Document()
+    _append_paragraphs(actual, [
+        _heading("Terms & <Conditions>", level=0),
+        ("Issue Price:\t100.00%\nSeries 2025-1 ", None),
+        ("", None),
+        _heading("Final Terms", level=1),
+    ])
+
+    assert etree.tostring(actual.element.body) == etree.tostring(expected.element.body)
+
+
+def test_create_docx_batch_parallel_saves_each_document(tmp_path):
+    from agents.pricing_supplement.document_generator import PRSDocumentGenerator
+
+    input_data = _sample_input()
+    output = asyncio.run(LargeTextPRSAgent(base_agent=None).generate_document_for_testing(input_data))
+    generator = PRSDocumentGenerator()
+    generator.output_dir = str(tmp_path)
+
+    paths = generator.create_docx_batch_parallel(
+        [(output, input_data, f"prs_parallel_{i}.docx") for i in range(3)],
+        max_workers=2,
+    )
+
+    assert paths == [str(tmp_path / f"prs_parallel_{i}.docx") for i in range(3)]
+    assert all((tmp_path / f"prs_parallel_{i}.docx").stat().st_size > 0 for i in range(3))
+
+
+def test_generated_batch_filenames_share_one_timestamp(tmp_path):
+    from agents.pricing_supplement.document_generator import PRSDocumentGenerator
+
+    input_data = _sample_input()
+    generator = PRSDocumentGenerator()
+    generator.output_dir = str(tmp_path)
+
+    paths = generator._docx_paths(
+        [(None, input_data, None), (None, input_data, "custom.docx")],
+        now=datetime(2025, 1, 29, 9, 30),
+    )
+
+    assert paths == [str(tmp_path / "PRS_20250129_0930.docx"), str(tmp_path / "custom.docx")]
+
+
+def test_default_config_is_shared_and_read_only():
+    from agents.pricing_supplement.config import PRSConfig
+
+    config = PRSConfig.get_default_config()
+
+    assert PRSConfig.get_default_config() is config
+    with pytest.raises(ValidationError):
+        config.max_document_length = 1
+
+
+def test_customize_template_substitutes_in_a_single_pass():
+    from agents.pricing_supplement.large_text_templates import customize_template
+
+    template = "No. [Number] of [Currency Symbol][Amount] ([Unknown])"
+    result = customize_template(template, {"Number": 7, "Currency Symbol": "US$", "Amount": "[Number]"})
+
+    assert result == "No. 7 of US$[Number] ([Unknown])"
+    assert customize_template(template, {}) is template
+
+
+def test_complete_document_matches_per_section_substitution():
+    from agents.pricing_supplement.large_text_templates import (
+        create_complete_document_from_templates,
+        customize_template,
+        get_template,
+        list_canonical_section_keys,
+    )
+
+    for product_data in ({"Note Name": "Autocallable Notes", "Series Number": "5"}, {"Note Name": "odd\x00value"}):
+        document = create_complete_document_from_templates(product_data)
+
+        assert list(document) == list(list_canonical_section_keys())
+        assert document == {key: customize_template(get_template(key), product_data) for key in document}
+
+
+def test_boilerplate_sections_are_returned_without_substitution():
+    from agents.pricing_supplement.large_text_templates import create_complete_document_from_templates, get_template
+
+    document = create_complete_document_from_templates({"Note Name": "Autocallable Notes"})
+
+    assert document["deferred_payment"] is get_template("deferred_payment")
+    assert "Autocallable Notes" in document["offering_overview"]
+
+
+def test_complete_document_is_cached_per_product_data():
+    from agents.pricing_supplement.large_text_templates import create_complete_document_from_templates
+
+    first = create_complete_document_from_templates({"Pricing Supplement Number": 1})
+    second = create_complete_document_from_templates({"Pricing Supplement Number": 1})
+    as_bool = create_complete_document_from_templates({"Pricing Supplement Number": True})
+    unhashable = create_complete_document_from_templates({"Pricing Supplement Number": [1]})
+
+    assert first == second and first is not second
+    assert "Pricing Supplement No. 1 " in first["regulatory_and_offering_disclaimers"]
+    assert "Pricing Supplement No. True " in as_bool["regulatory_and_offering_disclaimers"]
+    assert "Pricing Supplement No. [1] " in unhashable["regulatory_and_offering_disclaimers"]
+
+
+def test_complete_document_cache_distinguishes_equal_values_that_print_differently():
+    from agents.pricing_supplement.large_text_templates import create_complete_document_from_templates
+
+    key = "Maximum Offering Size in Dollars"
+    short = create_complete_document_from_templates({key: Decimal("5.0")})
+    long = create_complete_document_from_templates({key: Decimal("5.00")})
+
+    assert "5.0" in short["offering_overview"] and "5.00" not in short["offering_overview"]
+    assert "5.00" in long["offering_overview"]
+
+
+def test_render_to_stream_matches_joined_document():
+    from agents.pricing_supplement.large_text_templates import create_complete_document_from_templates, render_to_stream
+
+    product_data = {"Note Name": "Autocallable Notes", "Currency Symbol": "US$", "Maximum Offering Size in Dollars": 5}
+    out = io.StringIO()
+    render_to_stream(product_data, out)
+
+    assert out.getvalue() == "".join(create_complete_document_from_templates(product_data).values())
+
+
+def test_prs_input_is_immutable():
+
+    input_data = _sample_input()
+    assert input_data.pricing_date_str == "January 29, 2025"
+
+    with pytest.raises(ValidationError):
+        input_data.pricing_date = date(2026, 1, 29)
+
+
+def test_display_strings_follow_model_copy_updates():
+    input_data = _sample_input()
+    assert input_data.pricing_date_str == "January 29, 2025"
+
+    updated = input_data.model_copy(update={
+        "pricing_date": date(2026, 3, 3),
+        "maturity_date": date(2033, 3, 3),
+        "final_principal_amount": 25_000_000.0,
+        "minimum_denomination": 5_000.0,
+    })
+
+    assert updated.pricing_date_str == "March 03, 2026"
+    assert updated.pricing_date_compact == "20260303"
+    assert updated.maturity_date_str == "March 03, 2033"
+    assert updated.final_principal_amount_str == "25,000,000.00"
+    assert updated.final_principal_amount_rounded_str == "25,000,000"
+    assert updated.minimum_denomination_str == "5,000.00"
+    assert updated.minimum_denomination_int_str == "5,000"
+    assert input_data.pricing_date_str == "January 29, 2025"
+
+
+def test_batch_with_shared_pricing_date_gets_unique_filenames(tmp_path):
+    from agents.pricing_supplement.document_generator import PRSDocumentGenerator
+
+    input_data = _sample_input()
+    output = asyncio.run(LargeTextPRSAgent(base_agent=None).generate_document_for_testing(input_data))
+    generator = PRSDocumentGenerator()
+    generator.output_dir = str(tmp_path)
+
+    paths = generator.create_docx_batch(
+        [(output, input_data, None), (output, input_data, None)],
+        now=datetime(2025, 1, 29, 9, 30),
+    )
+
+    assert paths == [str(tmp_path / "PRS_20250129_0930.docx"), str(tmp_path / "PRS_20250129_0930_2.docx")]
+    assert all((tmp_path / name).stat().st_size > 0 for name in ["PRS_20250129_0930.docx", "PRS_20250129_0930_2.docx"])
+
+    with pytest.raises(ValueError):
+        generator._docx_paths([(None, input_data, "same.docx"), (None, input_data, "same.docx")])
+
+
+def test_placeholder_validation_cache_is_safe_across_threads():
+    from agents.pricing_supplement.document_generator import PRSDocumentGenerator
+
+    sections = [{"offering_overview": f"Series [Series Number] {i % 200}"} for i in range(2000)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(PRSDocumentGenerator.validate_no_unresolved_placeholders, sections))
+
+    assert results == [{"offering_overview": ["Series Number"]}] * len(sections)
+    assert len(PRSDocumentGenerator._validation_cache) <= PRSDocumentGenerator._VALIDATION_CACHE_SIZE
+
+
 if __name__ == "__main__":
     # Allow running directly
     test_large_text_prs_generation()
     print("✅ PRS Large Text basic test passed")
-
-
@@ -0,0 +1,41 @@
+"""
+Tests for the PRS knowledge base retrieval helpers.
+
+The stub LightRAG fixtures from tests/conftest.py record the queries, so no knowledge
+base or LLM is needed.
+"""
+
+import asyncio
+
+from agents.pricing_supplement.agent import _PRS_RETRIEVALS, _retrieve
+from core.query_cache import query_cache
+
+
+def test_retrieve_formats_query_and_heading(recording_lightrag):
+    query_cache.invalidate()
+
+    result = asyncio.run(_retrieve(recording_lightrag, "market_data", underlying_asset="S&P 500 Index", pricing_date="2025-01-29"))
+
+    assert recording_lightrag.queries == [("S&P 500 Index market data around 2025-01-29 pricing context", 6)]
+    assert result.startswith("**Market Data at Pricing:**\n")
+
+
+def test_retrieve_reports_errors_inline(failing_lightrag):
+    result = asyncio.run(_retrieve(failing_lightrag, "regulatory_pricing_disclosures", jurisdiction="Canada"))
+
+    assert result == "Error retrieving regulatory disclosures: knowledge base offline"
+
+
+def test_retrieval_templates_cover_composite_fields():
+    fields = {
+        "reference": "Base Shelf Prospectus",
+        "section_keywords": "summary",
+        "product_type": "autocallable",
+        "underlying_asset": "S&P 500 Index",
+        "pricing_date": "2025-01-29",
+        "jurisdiction": "Canada",
+        "audience": "institutional",
+    }
+
+    for _, query_template, _, _ in _PRS_RETRIEVALS.values():
+        assert "{" not in query_template.format(**fields)
@@ -0,0 +1,36 @@
+"""
+Template substitution tests shared by the BSP and PDS large text template modules.
+"""
+
+import importlib
+import re
+
+import pytest
+
+_PLACEHOLDER_RE = re.compile(r"\[([^\[\]]+)\]")
+
+
+@pytest.mark.parametrize("module_name", [
+    "agents.base_shelf_prospectus.large_text_templates",
+    "agents.product_supplement.large_text_templates",
+])
+def test_complete_document_output_is_unchanged_without_in_guard(module_name, reference_customize):
+    templates = importlib.import_module(module_name)
+    section_keys = list(templates.create_complete_document_from_templates({}))
+    placeholders = sorted({
+        name
+        for key in section_keys
+        for name in _PLACEHOLDER_RE.findall(templates.get_template(key))
+    })
+    assert placeholders
+
+    product_data = {name: (f"<{name}>" if i % 2 else i * 1.5) for i, name in enumerate(placeholders)}
+    product_data["Not In Any Template"] = "unused"
+
+    document = templates.create_complete_document_from_templates(product_data)
+
+    assert list(document) == section_keys
+    for key in section_keys:
+        template = templates.get_template(key)
+        assert document[key] == reference_customize(template, product_data)
+        assert templates.customize_template(template, {}) == template
@@ -0,0 +1,46 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+
+class RecordingLightRAG:
+    """LightRAG stand-in that records (query, top_k) pairs and echoes the query"""
+
+    def __init__(self):
+        self.queries = []
+
+    async def aquery(self, query, param=None):
+        self.queries.append((query, param.top_k))
+        return f"result for {query}"
+
+
+class FailingLightRAG:
+    """LightRAG stand-in whose queries always fail"""
+
+    async def aquery(self, query, param=None):
+        raise RuntimeError("knowledge base offline")
+
+
+def guarded_customize(template: str, variables: dict) -> str:
+    """Reference placeholder substitution: the original loop with an "in" guard before each replace"""
+    for placeholder, value in variables.items():
+        if f"[{placeholder}]" in template:
+            template = template.replace(f"[{placeholder}]", str(value))
+    return template
+
+
+@pytest.fixture
+def reference_customize():
+    return guarded_customize
+
+
+@pytest.fixture
+def recording_lightrag() -> RecordingLightRAG:
+    return RecordingLightRAG()
+
+
+@pytest.fixture
+def failing_lightrag() -> FailingLightRAG:
+    return FailingLightRAG()
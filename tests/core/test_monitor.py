@@ -0,0 +1,190 @@
+"""
+Tests for the agent monitor's alert bookkeeping and metrics.
+
+These exercise AgentMonitor directly and never create agents, so no LLM
+access is required.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from agents.monitor import AgentMonitor, Alert, AlertLevel, HealthCheck, MonitorStatus
+
+
+def _alert(message: str, hours_ago: float, level: AlertLevel = AlertLevel.WARNING) -> Alert:
+    return Alert(
+        agent_type="pricing_supplement",
+        level=level,
+        message=message,
+        timestamp=datetime.now() - timedelta(hours=hours_ago),
+    )
+
+
+def test_alert_history_is_bounded():
+    monitor = AgentMonitor(max_alerts=3)
+    for i, hours_ago in enumerate([4, 3, 2, 1]):
+        monitor._trigger_alert(_alert(str(i), hours_ago))
+
+    assert [a.message for a in monitor.get_alerts(hours=24)] == ["1", "2", "3"]
+    assert len(monitor.alerts) == 3
+    assert [a.message for a in monitor.get_alerts(AlertLevel.WARNING)] == ["1", "2", "3"]
+
+
+def test_get_alerts_filters_by_time_and_level():
+    monitor = AgentMonitor()
+    monitor._trigger_alert(_alert("old", 30))
+    monitor._trigger_alert(_alert("warning", 2))
+    monitor._trigger_alert(_alert("critical", 1, AlertLevel.CRITICAL))
+
+    assert [a.message for a in monitor.get_alerts()] == ["warning", "critical"]
+    assert [a.message for a in monitor.get_alerts(hours=1.5)] == ["critical"]
+    assert [a.message for a in monitor.get_alerts(AlertLevel.WARNING)] == ["warning"]
+
+
+def test_clear_alerts_drops_expired_entries():
+    monitor = AgentMonitor()
+    monitor._trigger_alert(_alert("old", 30))
+    monitor._trigger_alert(_alert("recent", 1))
+
+    monitor.clear_alerts(hours=24)
+
+    assert [a.message for a in monitor.get_alerts(hours=48)] == ["recent"]
+    assert len(monitor.alerts) == 1
+
+
+def test_performance_metrics_track_true_mean_and_success_rate():
+    monitor = AgentMonitor()
+    for response_time, status in [(1.0, MonitorStatus.HEALTHY), (2.0, MonitorStatus.CRITICAL), (6.0, MonitorStatus.HEALTHY)]:
+        monitor._update_performance_metrics("pricing_supplement", HealthCheck(
+            agent_type="pricing_supplement",
+            status=status,
+            timestamp=datetime.now(),
+            response_time=response_time,
+        ))
+
+    metrics = monitor.get_agent_performance("pricing_supplement")
+    assert metrics.total_requests == 3
+    assert metrics.response_time_avg == pytest.approx(3.0)
+    assert (metrics.response_time_min, metrics.response_time_max) == (1.0, 6.0)
+    assert metrics.error_count == 1
+    assert metrics.success_rate == pytest.approx(2 / 3)
+
+
+def test_monitoring_summary_is_recomputed_after_new_alerts():
+    monitor = AgentMonitor()
+    first = monitor.get_monitoring_summary()
+    assert monitor.get_monitoring_summary() is first
+
+    monitor._trigger_alert(_alert("recent", 0.1))
+
+    assert monitor.get_monitoring_summary()["recent_alerts"] == first["recent_alerts"] + 1
+
+
+def test_alerts_triggered_from_monitor_loop_reach_callbacks():
+    monitor = AgentMonitor()
+    received = []
+    monitor.add_alert_callback(received.append)
+
+    monitor._run_sync(_trigger_from_loop(monitor, _alert("from loop", 0.1)))
+
+    assert [a.message for a in monitor.get_alerts()] == ["from loop"]
+    assert [a.message for a in received] == ["from loop"]
+
+
+def test_agent_capabilities_are_probed_once_per_type():
+    monitor = AgentMonitor()
+
+    class _Agent:
+        def get_agent_info(self):
+            return {}
+
+        def initialize_lightrag(self):
+            pass
+
+    first = monitor._test_agent_functionality(_Agent(), "pricing_supplement")
+    del _Agent.initialize_lightrag
+    second = monitor._test_agent_functionality(_Agent(), "pricing_supplement")
+
+    assert first["details"]["knowledge_status"] == "available"
+    assert second["details"]["knowledge_status"] == "available"
+
+
+def test_slow_health_check_raises_response_time_warning():
+    monitor = AgentMonitor()
+    check = HealthCheck(
+        agent_type="pricing_supplement",
+        status=MonitorStatus.HEALTHY,
+        timestamp=datetime.now(),
+        response_time=12.5,
+    )
+
+    monitor._check_for_alerts("pricing_supplement", check)
+
+    assert check.response_time_ns == 12_500_000_000
+    assert [a.level for a in monitor.get_alerts()] == [AlertLevel.WARNING]
+
+
+def test_response_time_threshold_can_be_set_per_agent():
+    monitor = AgentMonitor()
+    monitor.response_time_thresholds_ns["pricing_supplement"] = 1_000_000_000
+    check = HealthCheck(
+        agent_type="pricing_supplement",
+        status=MonitorStatus.HEALTHY,
+        timestamp=datetime.now(),
+        response_time=2.0,
+    )
+
+    monitor._check_for_alerts("pricing_supplement", check)
+    monitor._check_for_alerts("ism", check)
+
+    assert [a.agent_type for a in monitor.get_alerts()] == ["pricing_supplement"]
+
+
+def test_out_of_order_alerts_are_indexed_by_timestamp():
+    monitor = AgentMonitor(max_alerts=3)
+    monitor._trigger_alert(_alert("1h", 1))
+    monitor._trigger_alert(_alert("3h", 3, AlertLevel.CRITICAL))
+    monitor._trigger_alert(_alert("2h", 2))
+
+    assert [a.message for a in monitor.get_alerts()] == ["3h", "2h", "1h"]
+    assert [a.message for a in monitor.get_alerts(hours=2.5)] == ["2h", "1h"]
+    assert [a.message for a in monitor.get_alerts(AlertLevel.WARNING, hours=2.5)] == ["2h", "1h"]
+
+    # A full history evicts the oldest alert, and ignores one older than everything retained
+    monitor._trigger_alert(_alert("30m", 0.5))
+    monitor._trigger_alert(_alert("4h", 4))
+    assert [a.message for a in monitor.alerts] == ["2h", "1h", "30m"]
+    assert monitor.get_alerts(AlertLevel.CRITICAL) == []
+
+    monitor.clear_alerts(hours=1.5)
+    assert [a.message for a in monitor.get_alerts()] == ["1h", "30m"]
+
+
+def test_alerts_attribute_includes_queued_alerts():
+    monitor = AgentMonitor()
+    monitor._alert_queue.put_nowait(_alert("queued", 1))
+
+    assert [a.message for a in monitor.alerts] == ["queued"]
+
+
+def test_performance_snapshot_does_not_change_after_it_is_taken():
+    monitor = AgentMonitor()
+    check = HealthCheck(
+        agent_type="pricing_supplement",
+        status=MonitorStatus.HEALTHY,
+        timestamp=datetime.now(),
+        response_time=1.0,
+    )
+    monitor._update_performance_metrics("pricing_supplement", check)
+    snapshot = monitor.get_all_performance_metrics()
+
+    monitor._update_performance_metrics("pricing_supplement", check)
+
+    assert snapshot["pricing_supplement"].total_requests == 1
+    assert monitor.get_all_performance_metrics()["pricing_supplement"].total_requests == 2
+    assert monitor.get_monitoring_summary()["performance_summary"]["pricing_supplement"]["total_requests"] == 2
+
+
+async def _trigger_from_loop(monitor: AgentMonitor, alert: Alert):
+    monitor._trigger_alert(alert)
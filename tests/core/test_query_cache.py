@@ -0,0 +1,104 @@
+"""
+Tests for the LightRAG query result cache.
+"""
+
+import asyncio
+
+from core.query_cache import QueryCache
+
+
+class _CountingLightRAG:
+    def __init__(self, working_dir: str):
+        self.working_dir = working_dir
+        self.calls = 0
+
+    async def aquery(self, query, param=None):
+        self.calls += 1
+        return f"{query} ({param.mode}, top_k={param.top_k})"
+
+
+def test_identical_queries_hit_the_cache():
+    cache = QueryCache()
+    lightrag = _CountingLightRAG("knowledge_bases/prs_kb")
+
+    first = asyncio.run(cache.aquery(lightrag, "final terms  template", top_k=8))
+    second = asyncio.run(cache.aquery(lightrag, " final terms template ", top_k=8))
+
+    assert first == second
+    assert lightrag.calls == 1
+
+
+def test_cache_key_includes_mode_top_k_and_knowledge_base():
+    cache = QueryCache()
+    prs = _CountingLightRAG("knowledge_bases/prs_kb")
+    pds = _CountingLightRAG("knowledge_bases/pds_kb")
+
+    asyncio.run(cache.aquery(prs, "fees", top_k=5))
+    asyncio.run(cache.aquery(prs, "fees", top_k=6))
+    asyncio.run(cache.aquery(prs, "fees", mode="local", top_k=5))
+    asyncio.run(cache.aquery(pds, "fees", top_k=5))
+
+    assert (prs.calls, pds.calls) == (3, 1)
+
+
+def test_expired_and_evicted_entries_are_refetched():
+    cache = QueryCache(maxsize=1, ttl=0.0)
+    lightrag = _CountingLightRAG("knowledge_bases/prs_kb")
+
+    asyncio.run(cache.aquery(lightrag, "fees"))
+    asyncio.run(cache.aquery(lightrag, "fees"))
+    assert lightrag.calls == 2
+
+    cache.ttl = 600.0
+    asyncio.run(cache.aquery(lightrag, "fees"))
+    asyncio.run(cache.aquery(lightrag, "distribution"))
+    asyncio.run(cache.aquery(lightrag, "fees"))
+    assert lightrag.calls == 5
+    assert len(cache) == 1
+
+
+def test_invalidate_clears_results():
+    cache = QueryCache()
+    lightrag = _CountingLightRAG("knowledge_bases/prs_kb")
+
+    asyncio.run(cache.aquery(lightrag, "fees"))
+    cache.invalidate()
+    asyncio.run(cache.aquery(lightrag, "fees"))
+
+    assert lightrag.calls == 2
+
+
+class _AnsweringLightRAG(_CountingLightRAG):
+    def __init__(self, working_dir: str, answer):
+        super().__init__(working_dir)
+        self.answer = answer
+
+    async def aquery(self, query, param=None):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.answer
+
+
+def test_empty_and_no_context_answers_are_not_cached():
+    from lightrag.prompt import PROMPTS
+
+    cache = QueryCache()
+    for answer in ["", None, PROMPTS["fail_response"]]:
+        lightrag = _AnsweringLightRAG("knowledge_bases/prs_kb", answer)
+
+        assert asyncio.run(cache.aquery(lightrag, "fees")) == answer
+        asyncio.run(cache.aquery(lightrag, "fees"))
+
+        assert lightrag.calls == 2
+    assert len(cache) == 0
+
+
+def test_concurrent_identical_queries_share_one_call():
+    cache = QueryCache()
+    lightrag = _AnsweringLightRAG("knowledge_bases/prs_kb", "fee schedule")
+
+    async def query_concurrently():
+        return await asyncio.gather(*(cache.aquery(lightrag, "fees") for _ in range(4)))
+
+    assert asyncio.run(query_concurrently()) == ["fee schedule"] * 4
+    assert lightrag.calls == 1